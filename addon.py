@@ -7,6 +7,7 @@ import hashlib
 import hmac
 import io
 import json
+import math
 import os
 import os.path as osp
 import re
@@ -17,14 +18,17 @@ import tempfile
 import threading
 import time
 import traceback
+import webbrowser
 import zipfile
 from contextlib import redirect_stdout, suppress
 from datetime import datetime
+from functools import lru_cache
 
+import bmesh
 import bpy
 import mathutils
 import requests
-from bpy.props import BoolProperty, IntProperty
+from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, StringProperty
 
 bl_info = {
     "name": "BlenderForge",
@@ -41,14 +45,27 @@ bl_info = {
 # API keys should be set via environment variables for security
 # Set BLENDERFORGE_RODIN_API_KEY environment variable to use Rodin API
 # Or configure via addon preferences
+@lru_cache(maxsize=1)
 def get_rodin_api_key():
-    """Get Rodin API key from environment or return None."""
+    """Get Rodin API key from environment or return None.
+
+    The result is cached for the session; unregister() clears it so
+    re-enabling the addon picks up a changed environment.
+    """
     return os.environ.get("BLENDERFORGE_RODIN_API_KEY")
 
 # Add User-Agent as required by Poly Haven API
 REQ_HEADERS = requests.utils.default_headers()
 REQ_HEADERS.update({"User-Agent": "blenderforge"})
 
+# Print addon lifecycle messages (register/unregister) to the console
+_DEBUG = False
+
+# The running BlenderForgeServer instance, owned by the start/stop operators
+_server = None
+# Panel status text, formatted once when the server starts rather than on every redraw
+_running_label = ""
+
 
 class BlenderForgeServer:
     def __init__(self, host="localhost", port=9876):
@@ -60,6 +77,7 @@ class BlenderForgeServer:
         # Generate auth token for secure communication
         self.auth_token = secrets.token_hex(32)
         self._temp_files = set()  # Track temp files for cleanup
+        self._command_handlers = self._build_command_handlers()
 
     def start(self):
         if self.running:
@@ -181,6 +199,14 @@ class BlenderForgeServer:
 
         print("Server thread stopped")
 
+    @staticmethod
+    def _encode_response(response, framed=False):
+        """Serialize a response, prefixing an 8-byte big-endian length when framed"""
+        payload = json.dumps(response).encode("utf-8")
+        if framed:
+            return len(payload).to_bytes(8, "big") + payload
+        return payload
+
     def _handle_client(self, client):
         """Handle connected client"""
         print("Client handler started")
@@ -202,13 +228,19 @@ class BlenderForgeServer:
                         command = json.loads(buffer.decode("utf-8"))
                         buffer = b""
 
-                        # Execute command in Blender's main thread
-                        def execute_wrapper():
+                        # Clients that ask for length framing get a size header before the JSON
+                        framed = command.get("framing") == "length"
+
+                        # Execute command in Blender's main thread. The command and framing are
+                        # bound as defaults so the timer never sees a later loop iteration's values.
+                        def execute_wrapper(command=command, framed=framed):
                             try:
                                 response = self.execute_command(command)
-                                response_json = json.dumps(response)
+                                # Encode outside the send guard so an unserializable result is
+                                # reported back as an error response instead of being dropped
+                                payload = self._encode_response(response, framed)
                                 try:
-                                    client.sendall(response_json.encode("utf-8"))
+                                    client.sendall(payload)
                                 except:
                                     print("Failed to send response - client disconnected")
                             except Exception as e:
@@ -216,7 +248,7 @@ class BlenderForgeServer:
                                 traceback.print_exc()
                                 try:
                                     error_response = {"status": "error", "message": str(e)}
-                                    client.sendall(json.dumps(error_response).encode("utf-8"))
+                                    client.sendall(self._encode_response(error_response, framed))
                                 except:
                                     pass
                             return None
@@ -248,22 +280,13 @@ class BlenderForgeServer:
             traceback.print_exc()
             return {"status": "error", "message": str(e)}
 
-    def _execute_command_internal(self, command):
-        """Internal command execution with proper context"""
-        cmd_type = command.get("type")
-        params = command.get("params", {})
-
-        # Verify auth token if provided (backwards compatible)
-        provided_token = command.get("auth_token")
-        if provided_token and provided_token != self.auth_token:
-            return {"status": "error", "message": "Invalid authentication token"}
-
-        # Add a handler for checking PolyHaven status
-        if cmd_type == "get_polyhaven_status":
-            return {"status": "success", "result": self.get_polyhaven_status()}
+    def _build_command_handlers(self):
+        """Build the command dispatch table once: command type -> (scene toggle, handler).
 
+        A toggle of None means the handler is always available.
+        """
         # Base handlers that are always available
-        handlers = {
+        base_handlers = {
             "get_scene_info": self.get_scene_info,
             "get_object_info": self.get_object_info,
             "get_viewport_screenshot": self.get_viewport_screenshot,
@@ -273,44 +296,33 @@ class BlenderForgeServer:
             "get_hyper3d_status": self.get_hyper3d_status,
             "get_sketchfab_status": self.get_sketchfab_status,
             "get_hunyuan3d_status": self.get_hunyuan3d_status,
+            "get_integrations_status": self.get_integrations_status,
         }
 
-        # Add Polyhaven handlers only if enabled
-        if bpy.context.scene.blenderforge_use_polyhaven:
-            polyhaven_handlers = {
+        # Integration handlers, keyed by the scene property that enables them
+        integration_handlers = {
+            "blenderforge_use_polyhaven": {
                 "get_polyhaven_categories": self.get_polyhaven_categories,
                 "search_polyhaven_assets": self.search_polyhaven_assets,
                 "download_polyhaven_asset": self.download_polyhaven_asset,
                 "set_texture": self.set_texture,
-            }
-            handlers.update(polyhaven_handlers)
-
-        # Add Hyper3d handlers only if enabled
-        if bpy.context.scene.blenderforge_use_hyper3d:
-            hyper3d_handlers = {
+            },
+            "blenderforge_use_hyper3d": {
                 "create_rodin_job": self.create_rodin_job,
                 "poll_rodin_job_status": self.poll_rodin_job_status,
                 "import_generated_asset": self.import_generated_asset,
-            }
-            handlers.update(hyper3d_handlers)
-
-        # Add Sketchfab handlers only if enabled
-        if bpy.context.scene.blenderforge_use_sketchfab:
-            sketchfab_handlers = {
+            },
+            "blenderforge_use_sketchfab": {
                 "search_sketchfab_models": self.search_sketchfab_models,
                 "get_sketchfab_model_preview": self.get_sketchfab_model_preview,
                 "download_sketchfab_model": self.download_sketchfab_model,
-            }
-            handlers.update(sketchfab_handlers)
-
-        # Add Hunyuan3d handlers only if enabled
-        if bpy.context.scene.blenderforge_use_hunyuan3d:
-            hunyuan_handlers = {
+            },
+            "blenderforge_use_hunyuan3d": {
                 "create_hunyuan_job": self.create_hunyuan_job,
                 "poll_hunyuan_job_status": self.poll_hunyuan_job_status,
                 "import_generated_asset_hunyuan": self.import_generated_asset_hunyuan,
-            }
-            handlers.update(hunyuan_handlers)
+            },
+        }
 
         # AI-powered feature handlers (always available)
         ai_handlers = {
@@ -330,9 +342,35 @@ class BlenderForgeServer:
             "auto_weight_paint": self.auto_weight_paint,
             "add_ik_controls": self.add_ik_controls,
         }
-        handlers.update(ai_handlers)
 
-        handler = handlers.get(cmd_type)
+        handlers = {name: (None, fn) for name, fn in base_handlers.items()}
+        for toggle, group in integration_handlers.items():
+            handlers.update({name: (toggle, fn) for name, fn in group.items()})
+        handlers.update({name: (None, fn) for name, fn in ai_handlers.items()})
+        return handlers
+
+    def _execute_command_internal(self, command):
+        """Internal command execution with proper context"""
+        cmd_type = command.get("type")
+        params = command.get("params", {})
+
+        # Verify auth token if provided (backwards compatible)
+        provided_token = command.get("auth_token")
+        if provided_token and provided_token != self.auth_token:
+            return {"status": "error", "message": "Invalid authentication token"}
+
+        # Add a handler for checking PolyHaven status
+        if cmd_type == "get_polyhaven_status":
+            return {"status": "success", "result": self.get_polyhaven_status()}
+
+        # Integration handlers are only dispatched while their scene toggle is on
+        handler = None
+        entry = self._command_handlers.get(cmd_type)
+        if entry:
+            toggle, handler = entry
+            if toggle and not getattr(bpy.context.scene, toggle):
+                handler = None
+
         if handler:
             try:
                 print(f"Executing handler for {cmd_type}")
@@ -388,11 +426,11 @@ class BlenderForgeServer:
         if obj.type != "MESH":
             raise TypeError("Object must be a mesh")
 
-        # Get the bounding box corners in local space
-        local_bbox_corners = [mathutils.Vector(corner) for corner in obj.bound_box]
-
-        # Convert to world coordinates
-        world_bbox_corners = [obj.matrix_world @ corner for corner in local_bbox_corners]
+        # Transform the 8 local bounding box corners to world space. The
+        # bound_box is maintained by Blender, so this stays O(1) regardless of
+        # vertex count; matrix_world is read once instead of once per corner.
+        matrix_world = obj.matrix_world
+        world_bbox_corners = [matrix_world @ mathutils.Vector(corner) for corner in obj.bound_box]
 
         # Compute axis-aligned min/max coordinates
         min_corner = mathutils.Vector(map(min, zip(*world_bbox_corners)))
@@ -400,6 +438,36 @@ class BlenderForgeServer:
 
         return [[*min_corner], [*max_corner]]
 
+    # Article + noun used when reporting an object of the wrong type
+    OBJECT_TYPE_LABELS = {'MESH': "a mesh", 'ARMATURE': "an armature"}
+
+    @classmethod
+    def _resolve_object(cls, name, obj_type=None, label="Object"):
+        """Look up an object by name and optionally check its type.
+
+        Returns (obj, None) on success, or (None, error_response) otherwise.
+        """
+        obj = bpy.data.objects.get(name)
+        if obj is None:
+            return None, {"error": f"{label} '{name}' not found"}
+        if obj_type is not None and obj.type != obj_type:
+            type_label = cls.OBJECT_TYPE_LABELS.get(obj_type, obj_type)
+            return None, {"error": f"Object '{name}' is not {type_label}"}
+        return obj, None
+
+    @staticmethod
+    def _select_only(objs, active):
+        """Select exactly `objs` and make `active` the active object.
+
+        Edits selection state directly instead of going through
+        bpy.ops.object.select_all, which carries operator/undo overhead.
+        """
+        for obj in bpy.context.selected_objects:
+            obj.select_set(False)
+        for obj in objs:
+            obj.select_set(True)
+        bpy.context.view_layer.objects.active = active
+
     def get_object_info(self, name):
         """Get detailed information about a specific object"""
         obj = bpy.data.objects.get(name)
@@ -1243,6 +1311,15 @@ class BlenderForgeServer:
             consent = True
         return {"consent": consent}
 
+    def get_integrations_status(self):
+        """Get the status of every asset integration in a single command"""
+        return {
+            "polyhaven": self.get_polyhaven_status(),
+            "sketchfab": self.get_sketchfab_status(),
+            "hyper3d": self.get_hyper3d_status(),
+            "hunyuan3d": self.get_hunyuan3d_status(),
+        }
+
     def get_polyhaven_status(self):
         """Get the current status of PolyHaven integration"""
         enabled = bpy.context.scene.blenderforge_use_polyhaven
@@ -2647,14 +2724,19 @@ class BlenderForgeServer:
             # Load image in Blender
             img = bpy.data.images.load(temp_path)
 
+            # Copy the pixels out in one bulk foreach_get instead of indexing
+            # img.pixels per element, then analyse them as an (N, 4) array
+            import numpy as np
+
+            pixels = np.empty(len(img.pixels), dtype=np.float32)
+            img.pixels.foreach_get(pixels)
+            rgba = pixels.reshape(-1, 4)
+
             # Analyze dominant color (simple average)
-            pixels = list(img.pixels)
-            r = sum(pixels[0::4]) / (len(pixels) // 4)
-            g = sum(pixels[1::4]) / (len(pixels) // 4)
-            b = sum(pixels[2::4]) / (len(pixels) // 4)
+            r, g, b = (float(c) for c in rgba[:, :3].mean(axis=0))
 
             # Estimate roughness from color variance
-            variance = sum((pixels[i] - r) ** 2 for i in range(0, len(pixels), 4)) / (len(pixels) // 4)
+            variance = float(np.mean((rgba[:, 0] - r) ** 2))
             estimated_roughness = min(0.9, max(0.1, variance * 10))
 
             # Create material
@@ -2716,6 +2798,58 @@ class BlenderForgeServer:
         "icosphere": lambda: bpy.ops.mesh.primitive_ico_sphere_add(),
     }
 
+    # bmesh equivalents of the default primitive_*_add geometry: (object name, builder).
+    # Types missing here (torus has no bmesh op) fall back to PRIMITIVES.
+    PRIMITIVE_BUILDERS = {
+        "cube": ("Cube", lambda bm: bmesh.ops.create_cube(bm, size=2.0, calc_uvs=True)),
+        "sphere": ("Sphere", lambda bm: bmesh.ops.create_uvsphere(
+            bm, u_segments=32, v_segments=16, radius=1.0, calc_uvs=True)),
+        "cylinder": ("Cylinder", lambda bm: bmesh.ops.create_cone(
+            bm, cap_ends=True, segments=32, radius1=1.0, radius2=1.0, depth=2.0, calc_uvs=True)),
+        "cone": ("Cone", lambda bm: bmesh.ops.create_cone(
+            bm, cap_ends=True, segments=32, radius1=1.0, radius2=0.0, depth=2.0, calc_uvs=True)),
+        "plane": ("Plane", lambda bm: bmesh.ops.create_grid(
+            bm, x_segments=1, y_segments=1, size=1.0, calc_uvs=True)),
+        "monkey": ("Suzanne", lambda bm: bmesh.ops.create_monkey(bm, calc_uvs=True)),
+        "circle": ("Circle", lambda bm: bmesh.ops.create_circle(
+            bm, cap_ends=False, segments=32, radius=1.0, calc_uvs=True)),
+        "grid": ("Grid", lambda bm: bmesh.ops.create_grid(
+            bm, x_segments=10, y_segments=10, size=1.0, calc_uvs=True)),
+        "icosphere": ("Icosphere", lambda bm: bmesh.ops.create_icosphere(
+            bm, subdivisions=2, radius=1.0, calc_uvs=True)),
+    }
+
+    def _get_primitive_template(self, primitive_type):
+        """Return the hidden template mesh for a primitive, building it with bmesh on first use"""
+        template_name = f".BlenderForge_{primitive_type}"
+        mesh = bpy.data.meshes.get(template_name)
+        if mesh is None:
+            bm = bmesh.new()
+            try:
+                bm.loops.layers.uv.new("UVMap")
+                self.PRIMITIVE_BUILDERS[primitive_type][1](bm)
+                mesh = bpy.data.meshes.new(template_name)
+                bm.to_mesh(mesh)
+            finally:
+                bm.free()
+        return mesh
+
+    def _add_primitive(self, primitive_type):
+        """Add a primitive at the 3D cursor without going through the mesh operators"""
+        if primitive_type not in self.PRIMITIVE_BUILDERS:
+            self.PRIMITIVES[primitive_type]()
+            return bpy.context.active_object
+
+        name = self.PRIMITIVE_BUILDERS[primitive_type][0]
+        # Each object gets its own copy so per-object materials and edits stay independent
+        mesh = self._get_primitive_template(primitive_type).copy()
+        mesh.name = name
+        obj = bpy.data.objects.new(name, mesh)
+        obj.location = bpy.context.scene.cursor.location
+        bpy.context.collection.objects.link(obj)
+        self._select_only([obj], obj)
+        return obj
+
     def nlp_create(self, description):
         """Create objects from natural language description"""
         try:
@@ -2742,22 +2876,17 @@ class BlenderForgeServer:
             elif primitive_type:
                 # Parse quantity
                 quantity = 1
-                import re
                 qty_match = re.search(r"(\d+)\s+" + primitive_type, desc_lower)
                 if qty_match:
                     quantity = int(qty_match.group(1))
 
                 for i in range(quantity):
-                    self.PRIMITIVES[primitive_type]()
-                    obj = bpy.context.active_object
+                    obj = self._add_primitive(primitive_type)
 
                     # Apply color if specified
                     for color_name, color_value in self.COLOR_KEYWORDS.items():
                         if color_name in desc_lower:
-                            mat = bpy.data.materials.new(name=f"{color_name.capitalize()}_Material")
-                            mat.use_nodes = True
-                            mat.node_tree.nodes["Principled BSDF"].inputs["Base Color"].default_value = color_value
-                            obj.data.materials.append(mat)
+                            obj.data.materials.append(self._get_color_material(color_name, color_value))
                             break
 
                     # Parse size
@@ -2789,16 +2918,25 @@ class BlenderForgeServer:
         except Exception as e:
             return {"error": str(e)}
 
+    # Move direction -> (location axis index, sign) for nlp_modify
+    MOVE_DIRECTIONS = {
+        "up": (2, 1),
+        "down": (2, -1),
+        "left": (0, -1),
+        "right": (0, 1),
+        "forward": (1, 1),
+        "backward": (1, -1),
+    }
+
     def nlp_modify(self, object_name, modification):
         """Modify an object using natural language"""
         try:
-            obj = bpy.data.objects.get(object_name)
-            if not obj:
-                return {"error": f"Object '{object_name}' not found"}
+            obj, error = self._resolve_object(object_name)
+            if error:
+                return error
 
             mod_lower = modification.lower()
             changes = []
-            import re
 
             # Scale modifications
             if "twice" in mod_lower or "double" in mod_lower:
@@ -2817,15 +2955,9 @@ class BlenderForgeServer:
             # Rotation modifications
             rot_match = re.search(r"rotate\s*(-?\d+\.?\d*)\s*(?:degrees?)?\s*(?:on\s*)?(x|y|z)?", mod_lower)
             if rot_match:
-                import math
                 angle = math.radians(float(rot_match.group(1)))
                 axis = rot_match.group(2) or "z"
-                if axis == "x":
-                    obj.rotation_euler.x += angle
-                elif axis == "y":
-                    obj.rotation_euler.y += angle
-                else:
-                    obj.rotation_euler.z += angle
+                obj.rotation_euler["xyz".index(axis)] += angle
                 changes.append(f"rotated {rot_match.group(1)} degrees on {axis}")
 
             # Position modifications
@@ -2833,49 +2965,37 @@ class BlenderForgeServer:
             if move_match:
                 distance = float(move_match.group(1))
                 direction = move_match.group(3) or "up"
-                if direction == "up":
-                    obj.location.z += distance
-                elif direction == "down":
-                    obj.location.z -= distance
-                elif direction in ["left"]:
-                    obj.location.x -= distance
-                elif direction in ["right"]:
-                    obj.location.x += distance
-                elif direction == "forward":
-                    obj.location.y += distance
-                elif direction == "backward":
-                    obj.location.y -= distance
+                axis_index, sign = self.MOVE_DIRECTIONS[direction]
+                obj.location[axis_index] += sign * distance
                 changes.append(f"moved {distance} {direction}")
 
             # Color modifications
             for color_name, color_value in self.COLOR_KEYWORDS.items():
                 if color_name in mod_lower:
                     if obj.data.materials:
-                        mat = obj.data.materials[0]
+                        mat = self._own_material(obj)
+                        mat.node_tree.nodes["Principled BSDF"].inputs["Base Color"].default_value = color_value
                     else:
-                        mat = bpy.data.materials.new(name=f"{color_name.capitalize()}_Material")
-                        mat.use_nodes = True
-                        obj.data.materials.append(mat)
-                    mat.node_tree.nodes["Principled BSDF"].inputs["Base Color"].default_value = color_value
+                        obj.data.materials.append(self._get_color_material(color_name, color_value))
                     changes.append(f"changed color to {color_name}")
                     break
 
             # Material properties
             if "shiny" in mod_lower or "glossy" in mod_lower:
                 if obj.data.materials:
-                    mat = obj.data.materials[0]
+                    mat = self._own_material(obj)
                     mat.node_tree.nodes["Principled BSDF"].inputs["Roughness"].default_value = 0.1
                     changes.append("made shiny")
 
             if "matte" in mod_lower or "rough" in mod_lower:
                 if obj.data.materials:
-                    mat = obj.data.materials[0]
+                    mat = self._own_material(obj)
                     mat.node_tree.nodes["Principled BSDF"].inputs["Roughness"].default_value = 0.9
                     changes.append("made matte")
 
             if "metallic" in mod_lower:
                 if obj.data.materials:
-                    mat = obj.data.materials[0]
+                    mat = self._own_material(obj)
                     mat.node_tree.nodes["Principled BSDF"].inputs["Metallic"].default_value = 0.9
                     changes.append("made metallic")
 
@@ -2892,105 +3012,106 @@ class BlenderForgeServer:
         except Exception as e:
             return {"error": str(e)}
 
+    # Custom property marking the cached color materials from _get_color_material
+    SHARED_MATERIAL_TAG = "blenderforge_shared"
+
+    @classmethod
+    def _get_color_material(cls, color_name, color_value, name_prefix="BlenderForge_"):
+        """Return the shared '{name_prefix}{color_name}' material, creating it on first use.
+
+        Repeated generator calls reuse the existing datablock instead of leaking
+        a new '.001', '.002', ... copy each time.
+        """
+        mat_name = f"{name_prefix}{color_name}"
+        mat = bpy.data.materials.get(mat_name)
+        if mat is None:
+            mat = bpy.data.materials.new(name=mat_name)
+            mat.use_nodes = True
+            mat.node_tree.nodes["Principled BSDF"].inputs["Base Color"].default_value = color_value
+            mat[cls.SHARED_MATERIAL_TAG] = True
+        return mat
+
+    @classmethod
+    def _own_material(cls, obj):
+        """Return obj's first material, copying it first if editing it would affect others.
+
+        Cached color materials are always copied, even with a single user, so later
+        requests for that color never pick up this object's edits.
+        """
+        mat = obj.data.materials[0]
+        if mat.get(cls.SHARED_MATERIAL_TAG) or mat.users > 1:
+            mat = mat.copy()
+            if cls.SHARED_MATERIAL_TAG in mat:
+                del mat[cls.SHARED_MATERIAL_TAG]
+            obj.data.materials[0] = mat
+        return mat
+
+    def _create_box_object(self, name, boxes):
+        """Build a single mesh object from (location, scale) unit-cube parts.
+
+        The parts are written straight into one bmesh, which avoids an operator
+        call per part plus the final bpy.ops.object.join. The object origin is
+        placed at the first part, matching what the join used to produce.
+        """
+        origin = mathutils.Vector(boxes[0][0])
+        bm = bmesh.new()
+        try:
+            bm.loops.layers.uv.new("UVMap")
+            for location, scale in boxes:
+                matrix = mathutils.Matrix.LocRotScale(mathutils.Vector(location) - origin, None, scale)
+                bmesh.ops.create_cube(bm, size=1.0, matrix=matrix, calc_uvs=True)
+            mesh = bpy.data.meshes.new(name)
+            bm.to_mesh(mesh)
+        finally:
+            bm.free()
+
+        obj = bpy.data.objects.new(name, mesh)
+        obj.location = origin
+        bpy.context.collection.objects.link(obj)
+        self._select_only([obj], obj)
+        return obj
+
     def _generate_table(self, description):
         """Generate a simple table"""
-        # Create table top
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0.75))
-        top = bpy.context.active_object
-        top.scale = (1.5, 0.8, 0.05)
-        top.name = "Table_Top"
-
-        # Create legs
+        # Table top, then legs
         leg_positions = [(-0.6, -0.3, 0.35), (0.6, -0.3, 0.35), (-0.6, 0.3, 0.35), (0.6, 0.3, 0.35)]
-        legs = []
-        for i, pos in enumerate(leg_positions):
-            bpy.ops.mesh.primitive_cube_add(size=1, location=pos)
-            leg = bpy.context.active_object
-            leg.scale = (0.05, 0.05, 0.35)
-            leg.name = f"Table_Leg_{i+1}"
-            legs.append(leg)
-
-        # Join all parts
-        bpy.ops.object.select_all(action='DESELECT')
-        top.select_set(True)
-        for leg in legs:
-            leg.select_set(True)
-        bpy.context.view_layer.objects.active = top
-        bpy.ops.object.join()
-        top.name = "Table"
+        boxes = [((0, 0, 0.75), (1.5, 0.8, 0.05))]
+        boxes += [(pos, (0.05, 0.05, 0.35)) for pos in leg_positions]
+        table = self._create_box_object("Table", boxes)
 
         # Apply color if specified
         for color_name, color_value in self.COLOR_KEYWORDS.items():
             if color_name in description:
-                mat = bpy.data.materials.new(name=f"Table_{color_name}")
-                mat.use_nodes = True
-                mat.node_tree.nodes["Principled BSDF"].inputs["Base Color"].default_value = color_value
-                top.data.materials.append(mat)
+                table.data.materials.append(self._get_color_material(color_name, color_value, "Table_"))
                 break
 
-        return top
+        return table
 
     def _generate_chair(self, description):
         """Generate a simple chair"""
-        # Seat
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(0, 0, 0.45))
-        seat = bpy.context.active_object
-        seat.scale = (0.5, 0.5, 0.05)
-        seat.name = "Chair_Seat"
-
-        # Back
-        bpy.ops.mesh.primitive_cube_add(size=1, location=(0, -0.22, 0.75))
-        back = bpy.context.active_object
-        back.scale = (0.5, 0.03, 0.3)
-        back.name = "Chair_Back"
-
-        # Legs
+        # Seat, back, then legs
         leg_positions = [(-0.2, -0.2, 0.2), (0.2, -0.2, 0.2), (-0.2, 0.2, 0.2), (0.2, 0.2, 0.2)]
-        legs = []
-        for i, pos in enumerate(leg_positions):
-            bpy.ops.mesh.primitive_cube_add(size=1, location=pos)
-            leg = bpy.context.active_object
-            leg.scale = (0.03, 0.03, 0.2)
-            leg.name = f"Chair_Leg_{i+1}"
-            legs.append(leg)
-
-        # Join
-        bpy.ops.object.select_all(action='DESELECT')
-        seat.select_set(True)
-        back.select_set(True)
-        for leg in legs:
-            leg.select_set(True)
-        bpy.context.view_layer.objects.active = seat
-        bpy.ops.object.join()
-        seat.name = "Chair"
-
-        return seat
+        boxes = [((0, 0, 0.45), (0.5, 0.5, 0.05)), ((0, -0.22, 0.75), (0.5, 0.03, 0.3))]
+        boxes += [(pos, (0.03, 0.03, 0.2)) for pos in leg_positions]
+        chair = self._create_box_object("Chair", boxes)
+
+        # Apply color if specified
+        for color_name, color_value in self.COLOR_KEYWORDS.items():
+            if color_name in description:
+                chair.data.materials.append(self._get_color_material(color_name, color_value, "Chair_"))
+                break
+
+        return chair
 
     def _generate_stairs(self, description):
         """Generate simple stairs"""
-        import re
         steps = 5
         step_match = re.search(r"(\d+)\s*step", description)
         if step_match:
             steps = int(step_match.group(1))
 
-        all_steps = []
-        for i in range(steps):
-            bpy.ops.mesh.primitive_cube_add(size=1, location=(0, i * 0.3, i * 0.2))
-            step = bpy.context.active_object
-            step.scale = (1, 0.3, 0.1)
-            step.name = f"Step_{i+1}"
-            all_steps.append(step)
-
-        # Join
-        bpy.ops.object.select_all(action='DESELECT')
-        for step in all_steps:
-            step.select_set(True)
-        bpy.context.view_layer.objects.active = all_steps[0]
-        bpy.ops.object.join()
-        all_steps[0].name = "Stairs"
-
-        return all_steps[0]
+        boxes = [((0, i * 0.3, i * 0.2), (1, 0.3, 0.1)) for i in range(steps)]
+        return self._create_box_object("Stairs", boxes)
 
     # endregion
 
@@ -2999,11 +3120,12 @@ class BlenderForgeServer:
     def analyze_scene_composition(self):
         """Analyze scene and provide feedback"""
         try:
-            scene = bpy.context.scene
+            buckets = self._bucket_scene_objects()
+            meshes = buckets.get('MESH', [])
             analysis = {
-                "lighting": self._analyze_lighting(),
-                "composition": self._analyze_composition(),
-                "materials": self._analyze_materials(),
+                "lighting": self._analyze_lighting(buckets.get('LIGHT', [])),
+                "composition": self._analyze_composition(meshes),
+                "materials": self._analyze_materials(meshes),
                 "overall_score": 0,
                 "recommendations": [],
             }
@@ -3027,9 +3149,16 @@ class BlenderForgeServer:
         except Exception as e:
             return {"error": str(e)}
 
-    def _analyze_lighting(self):
+    @staticmethod
+    def _bucket_scene_objects():
+        """Group scene objects by type in a single pass over the scene"""
+        buckets = {}
+        for obj in bpy.context.scene.objects:
+            buckets.setdefault(obj.type, []).append(obj)
+        return buckets
+
+    def _analyze_lighting(self, lights):
         """Analyze scene lighting"""
-        lights = [obj for obj in bpy.context.scene.objects if obj.type == 'LIGHT']
         score = 50
         suggestions = []
 
@@ -3053,9 +3182,10 @@ class BlenderForgeServer:
 
         # Check light types
         light_types = [l.data.type for l in lights]
-        if 'SUN' in light_types:
+        present_types = set(light_types)
+        if 'SUN' in present_types:
             score += 5
-        if 'AREA' in light_types:
+        if 'AREA' in present_types:
             score += 5
 
         return {
@@ -3066,10 +3196,9 @@ class BlenderForgeServer:
             "suggestions": suggestions,
         }
 
-    def _analyze_composition(self):
+    def _analyze_composition(self, objects):
         """Analyze scene composition"""
         camera = bpy.context.scene.camera
-        objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
         score = 50
         suggestions = []
 
@@ -3107,34 +3236,36 @@ class BlenderForgeServer:
             "suggestions": suggestions,
         }
 
-    def _analyze_materials(self):
+    def _analyze_materials(self, objects):
         """Analyze scene materials"""
-        objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
         score = 50
         suggestions = []
 
-        objects_without_materials = []
+        # Single pass: count objects without materials (keeping only the few
+        # names we may report) and collect the set of used material names
+        missing_count = 0
+        missing_names = []
+        materials = set()
         for obj in objects:
-            if not obj.data.materials:
-                objects_without_materials.append(obj.name)
+            obj_materials = obj.data.materials
+            if not obj_materials:
+                missing_count += 1
+                if len(missing_names) < 3:
+                    missing_names.append(obj.name)
+            else:
+                materials.update(mat.name for mat in obj_materials if mat)
 
-        if objects_without_materials:
-            score -= len(objects_without_materials) * 5
-            if len(objects_without_materials) <= 3:
-                suggestions.append(f"Objects without materials: {', '.join(objects_without_materials)}")
+        if missing_count:
+            score -= missing_count * 5
+            if missing_count <= 3:
+                suggestions.append(f"Objects without materials: {', '.join(missing_names)}")
             else:
-                suggestions.append(f"{len(objects_without_materials)} objects have no materials")
+                suggestions.append(f"{missing_count} objects have no materials")
         else:
             score = 70
             suggestions.append("All objects have materials assigned")
 
         # Check material variety
-        materials = set()
-        for obj in objects:
-            for mat in obj.data.materials:
-                if mat:
-                    materials.add(mat.name)
-
         if len(materials) > 5:
             score += 10
             suggestions.append("Good material variety in scene")
@@ -3142,7 +3273,7 @@ class BlenderForgeServer:
         return {
             "score": min(100, max(0, score)),
             "material_count": len(materials),
-            "objects_without_materials": len(objects_without_materials),
+            "objects_without_materials": missing_count,
             "suggestions": suggestions,
         }
 
@@ -3150,23 +3281,25 @@ class BlenderForgeServer:
         """Get specific improvement suggestions"""
         try:
             suggestions = {"high_priority": [], "medium_priority": [], "low_priority": []}
+            buckets = self._bucket_scene_objects()
+            meshes = buckets.get('MESH', [])
 
             if focus_area in ["all", "lighting"]:
-                lighting = self._analyze_lighting()
+                lighting = self._analyze_lighting(buckets.get('LIGHT', []))
                 if lighting["score"] < 50:
                     suggestions["high_priority"].extend(lighting["suggestions"])
                 else:
                     suggestions["medium_priority"].extend(lighting["suggestions"])
 
             if focus_area in ["all", "composition"]:
-                composition = self._analyze_composition()
+                composition = self._analyze_composition(meshes)
                 if composition["score"] < 50:
                     suggestions["high_priority"].extend(composition["suggestions"])
                 else:
                     suggestions["low_priority"].extend(composition["suggestions"])
 
             if focus_area in ["all", "materials"]:
-                materials = self._analyze_materials()
+                materials = self._analyze_materials(meshes)
                 if materials["score"] < 50:
                     suggestions["medium_priority"].extend(materials["suggestions"])
                 else:
@@ -3176,96 +3309,102 @@ class BlenderForgeServer:
         except Exception as e:
             return {"error": str(e)}
 
+    # Light rigs used by auto_optimize_lighting
+    LIGHTING_STYLES = {
+        # Three-point lighting
+        "studio": {
+            "lights": [
+                {"name": "Key_Light", "light_type": 'AREA', "location": (4, -4, 5),
+                 "energy": 1000, "rotation": (1.0, 0.0, 0.8)},
+                {"name": "Fill_Light", "light_type": 'AREA', "location": (-3, -2, 3),
+                 "energy": 300, "rotation": (1.2, 0.0, -0.8)},
+                {"name": "Rim_Light", "light_type": 'AREA', "location": (0, 4, 4),
+                 "energy": 500, "rotation": (0.5, 3.14, 0.0)},
+            ],
+            "changes": ["Added key light", "Added fill light", "Added rim light"],
+        },
+        # Sun light
+        "outdoor": {
+            "lights": [
+                {"name": "Sun", "light_type": 'SUN', "location": (0, 0, 10),
+                 "energy": 5, "rotation": (0.8, 0.2, 0.5)},
+            ],
+            "changes": ["Added sun light"],
+        },
+        # Single strong light with shadows
+        "dramatic": {
+            "lights": [
+                {"name": "Dramatic_Spot", "light_type": 'SPOT', "location": (5, -5, 6),
+                 "energy": 2000, "rotation": (1.0, 0.0, 0.8), "spot_size": 0.8},
+            ],
+            "changes": ["Added dramatic spot light"],
+        },
+        # Large area lights for soft shadows
+        "soft": {
+            "lights": [
+                {"name": "Soft_Light", "light_type": 'AREA', "location": (0, 0, 5),
+                 "energy": 800, "size": 10},
+            ],
+            "changes": ["Added large soft area light"],
+        },
+        # Clean product photography lighting
+        "product": {
+            "lights": [
+                {"name": f"Product_Light_{i+1}", "light_type": 'AREA', "location": pos,
+                 "energy": 500, "size": 2}
+                for i, pos in enumerate([(3, -3, 3), (-3, -3, 3), (0, 3, 2)])
+            ],
+            "changes": ["Added product photography lighting"],
+        },
+        # Warm key, cool fill
+        "cinematic": {
+            "lights": [
+                {"name": "Cinematic_Key", "light_type": 'AREA', "location": (4, -3, 4),
+                 "energy": 800, "color": (1.0, 0.9, 0.8)},
+                {"name": "Cinematic_Fill", "light_type": 'AREA', "location": (-3, -2, 3),
+                 "energy": 200, "color": (0.8, 0.9, 1.0)},
+            ],
+            "changes": ["Added warm key light", "Added cool fill light"],
+        },
+    }
+
+    @staticmethod
+    def _add_light(name, light_type, location, energy, rotation=None, size=None, color=None,
+                   spot_size=None):
+        """Create a light object through the data API and link it to the active collection"""
+        light_data = bpy.data.lights.new(name=name, type=light_type)
+        light_data.energy = energy
+        if size is not None:
+            light_data.size = size
+        if color is not None:
+            light_data.color = color
+        if spot_size is not None:
+            light_data.spot_size = spot_size
+
+        light_obj = bpy.data.objects.new(name, light_data)
+        light_obj.location = location
+        if rotation is not None:
+            light_obj.rotation_euler = rotation
+        bpy.context.collection.objects.link(light_obj)
+        return light_obj
+
     def auto_optimize_lighting(self, style="studio"):
         """Automatically set up lighting based on style"""
         try:
             changes = []
 
-            # Remove existing lights if requested
-            for obj in list(bpy.context.scene.objects):
-                if obj.type == 'LIGHT':
-                    bpy.data.objects.remove(obj, do_unlink=True)
-                    changes.append(f"Removed existing light: {obj.name}")
-
-            if style == "studio":
-                # Three-point lighting
-                # Key light
-                bpy.ops.object.light_add(type='AREA', location=(4, -4, 5))
-                key = bpy.context.active_object
-                key.name = "Key_Light"
-                key.data.energy = 1000
-                key.rotation_euler = (1.0, 0.0, 0.8)
-                changes.append("Added key light")
-
-                # Fill light
-                bpy.ops.object.light_add(type='AREA', location=(-3, -2, 3))
-                fill = bpy.context.active_object
-                fill.name = "Fill_Light"
-                fill.data.energy = 300
-                fill.rotation_euler = (1.2, 0.0, -0.8)
-                changes.append("Added fill light")
-
-                # Rim light
-                bpy.ops.object.light_add(type='AREA', location=(0, 4, 4))
-                rim = bpy.context.active_object
-                rim.name = "Rim_Light"
-                rim.data.energy = 500
-                rim.rotation_euler = (0.5, 3.14, 0.0)
-                changes.append("Added rim light")
-
-            elif style == "outdoor":
-                # Sun light
-                bpy.ops.object.light_add(type='SUN', location=(0, 0, 10))
-                sun = bpy.context.active_object
-                sun.name = "Sun"
-                sun.data.energy = 5
-                sun.rotation_euler = (0.8, 0.2, 0.5)
-                changes.append("Added sun light")
-
-            elif style == "dramatic":
-                # Single strong light with shadows
-                bpy.ops.object.light_add(type='SPOT', location=(5, -5, 6))
-                spot = bpy.context.active_object
-                spot.name = "Dramatic_Spot"
-                spot.data.energy = 2000
-                spot.data.spot_size = 0.8
-                spot.rotation_euler = (1.0, 0.0, 0.8)
-                changes.append("Added dramatic spot light")
-
-            elif style == "soft":
-                # Large area lights for soft shadows
-                bpy.ops.object.light_add(type='AREA', location=(0, 0, 5))
-                soft = bpy.context.active_object
-                soft.name = "Soft_Light"
-                soft.data.energy = 800
-                soft.data.size = 10
-                changes.append("Added large soft area light")
-
-            elif style == "product":
-                # Clean product photography lighting
-                for i, pos in enumerate([(3, -3, 3), (-3, -3, 3), (0, 3, 2)]):
-                    bpy.ops.object.light_add(type='AREA', location=pos)
-                    light = bpy.context.active_object
-                    light.name = f"Product_Light_{i+1}"
-                    light.data.energy = 500
-                    light.data.size = 2
-                changes.append("Added product photography lighting")
-
-            elif style == "cinematic":
-                # Warm key, cool fill
-                bpy.ops.object.light_add(type='AREA', location=(4, -3, 4))
-                key = bpy.context.active_object
-                key.name = "Cinematic_Key"
-                key.data.energy = 800
-                key.data.color = (1.0, 0.9, 0.8)
-                changes.append("Added warm key light")
-
-                bpy.ops.object.light_add(type='AREA', location=(-3, -2, 3))
-                fill = bpy.context.active_object
-                fill.name = "Cinematic_Fill"
-                fill.data.energy = 200
-                fill.data.color = (0.8, 0.9, 1.0)
-                changes.append("Added cool fill light")
+            # Remove existing lights in one batch (single depsgraph update)
+            old_lights = [obj for obj in bpy.context.scene.objects if obj.type == 'LIGHT']
+            if old_lights:
+                old_names = [obj.name for obj in old_lights]
+                bpy.data.batch_remove(ids=old_lights)
+                changes.extend(f"Removed existing light: {name}" for name in old_names)
+
+            rig = self.LIGHTING_STYLES.get(style)
+            if rig:
+                for spec in rig["lights"]:
+                    self._add_light(**spec)
+                changes.extend(rig["changes"])
 
             return {
                 "style_applied": style,
@@ -3282,11 +3421,9 @@ class BlenderForgeServer:
     def auto_rig(self, mesh_name, rig_type="humanoid"):
         """Automatically rig a character mesh"""
         try:
-            mesh_obj = bpy.data.objects.get(mesh_name)
-            if not mesh_obj:
-                return {"error": f"Mesh '{mesh_name}' not found"}
-            if mesh_obj.type != 'MESH':
-                return {"error": f"Object '{mesh_name}' is not a mesh"}
+            mesh_obj, error = self._resolve_object(mesh_name, 'MESH', label="Mesh")
+            if error:
+                return error
 
             # Get mesh bounds
             bounds = self._get_aabb(mesh_obj)
@@ -3320,10 +3457,7 @@ class BlenderForgeServer:
             bpy.ops.object.mode_set(mode='OBJECT')
 
             # Parent mesh to armature with automatic weights
-            bpy.ops.object.select_all(action='DESELECT')
-            mesh_obj.select_set(True)
-            armature.select_set(True)
-            bpy.context.view_layer.objects.active = armature
+            self._select_only([mesh_obj, armature], armature)
             bpy.ops.object.parent_set(type='ARMATURE_AUTO')
 
             return {
@@ -3339,57 +3473,59 @@ class BlenderForgeServer:
         """Create humanoid bone structure"""
         bones = []
 
+        eb = arm_data.edit_bones
+
         # Remove default bone
-        if arm_data.edit_bones:
-            for bone in list(arm_data.edit_bones):
-                arm_data.edit_bones.remove(bone)
+        if eb:
+            for bone in list(eb):
+                eb.remove(bone)
 
         # Spine
-        spine_base = arm_data.edit_bones.new("Spine")
+        spine_base = eb.new("Spine")
         spine_base.head = (0, 0, base_z + height * 0.4)
         spine_base.tail = (0, 0, base_z + height * 0.55)
         bones.append("Spine")
 
-        spine_mid = arm_data.edit_bones.new("Spine.001")
+        spine_mid = eb.new("Spine.001")
         spine_mid.head = spine_base.tail
         spine_mid.tail = (0, 0, base_z + height * 0.7)
         spine_mid.parent = spine_base
         bones.append("Spine.001")
 
         # Neck and Head
-        neck = arm_data.edit_bones.new("Neck")
+        neck = eb.new("Neck")
         neck.head = spine_mid.tail
         neck.tail = (0, 0, base_z + height * 0.8)
         neck.parent = spine_mid
         bones.append("Neck")
 
-        head = arm_data.edit_bones.new("Head")
+        head = eb.new("Head")
         head.head = neck.tail
         head.tail = (0, 0, base_z + height * 1.0)
         head.parent = neck
         bones.append("Head")
 
         # Hips
-        hips = arm_data.edit_bones.new("Hips")
+        hips = eb.new("Hips")
         hips.head = (0, 0, base_z + height * 0.4)
         hips.tail = (0, 0, base_z + height * 0.35)
         bones.append("Hips")
 
         # Legs
         for side, x_offset in [("L", 0.1 * height), ("R", -0.1 * height)]:
-            thigh = arm_data.edit_bones.new(f"Thigh.{side}")
+            thigh = eb.new(f"Thigh.{side}")
             thigh.head = (x_offset, 0, base_z + height * 0.4)
             thigh.tail = (x_offset, 0, base_z + height * 0.2)
             thigh.parent = hips
             bones.append(f"Thigh.{side}")
 
-            shin = arm_data.edit_bones.new(f"Shin.{side}")
+            shin = eb.new(f"Shin.{side}")
             shin.head = thigh.tail
             shin.tail = (x_offset, 0, base_z + height * 0.05)
             shin.parent = thigh
             bones.append(f"Shin.{side}")
 
-            foot = arm_data.edit_bones.new(f"Foot.{side}")
+            foot = eb.new(f"Foot.{side}")
             foot.head = shin.tail
             foot.tail = (x_offset, -0.1 * height, base_z)
             foot.parent = shin
@@ -3397,25 +3533,25 @@ class BlenderForgeServer:
 
         # Arms
         for side, x_offset in [("L", 0.15 * height), ("R", -0.15 * height)]:
-            shoulder = arm_data.edit_bones.new(f"Shoulder.{side}")
+            shoulder = eb.new(f"Shoulder.{side}")
             shoulder.head = (0, 0, base_z + height * 0.7)
             shoulder.tail = (x_offset, 0, base_z + height * 0.7)
             shoulder.parent = spine_mid
             bones.append(f"Shoulder.{side}")
 
-            upper_arm = arm_data.edit_bones.new(f"UpperArm.{side}")
+            upper_arm = eb.new(f"UpperArm.{side}")
             upper_arm.head = shoulder.tail
             upper_arm.tail = (x_offset * 2, 0, base_z + height * 0.55)
             upper_arm.parent = shoulder
             bones.append(f"UpperArm.{side}")
 
-            forearm = arm_data.edit_bones.new(f"Forearm.{side}")
+            forearm = eb.new(f"Forearm.{side}")
             forearm.head = upper_arm.tail
             forearm.tail = (x_offset * 2.5, 0, base_z + height * 0.4)
             forearm.parent = upper_arm
             bones.append(f"Forearm.{side}")
 
-            hand = arm_data.edit_bones.new(f"Hand.{side}")
+            hand = eb.new(f"Hand.{side}")
             hand.head = forearm.tail
             hand.tail = (x_offset * 2.7, 0, base_z + height * 0.35)
             hand.parent = forearm
@@ -3427,24 +3563,25 @@ class BlenderForgeServer:
         """Create quadruped bone structure"""
         bones = []
 
-        for bone in list(arm_data.edit_bones):
-            arm_data.edit_bones.remove(bone)
+        eb = arm_data.edit_bones
+        for bone in list(eb):
+            eb.remove(bone)
 
         # Spine
-        spine = arm_data.edit_bones.new("Spine")
+        spine = eb.new("Spine")
         spine.head = (0, -width * 0.3, base_z + height * 0.5)
         spine.tail = (0, width * 0.3, base_z + height * 0.5)
         bones.append("Spine")
 
         # Head
-        head = arm_data.edit_bones.new("Head")
+        head = eb.new("Head")
         head.head = spine.tail
         head.tail = (0, width * 0.5, base_z + height * 0.6)
         head.parent = spine
         bones.append("Head")
 
         # Tail
-        tail = arm_data.edit_bones.new("Tail")
+        tail = eb.new("Tail")
         tail.head = spine.head
         tail.tail = (0, -width * 0.5, base_z + height * 0.4)
         tail.parent = spine
@@ -3459,13 +3596,13 @@ class BlenderForgeServer:
         ]
 
         for name, (x, y) in leg_positions:
-            upper = arm_data.edit_bones.new(f"UpperLeg.{name}")
+            upper = eb.new(f"UpperLeg.{name}")
             upper.head = (x, y, base_z + height * 0.5)
             upper.tail = (x, y, base_z + height * 0.25)
             upper.parent = spine
             bones.append(f"UpperLeg.{name}")
 
-            lower = arm_data.edit_bones.new(f"LowerLeg.{name}")
+            lower = eb.new(f"LowerLeg.{name}")
             lower.head = upper.tail
             lower.tail = (x, y, base_z)
             lower.parent = upper
@@ -3477,16 +3614,17 @@ class BlenderForgeServer:
         """Create simple bone chain"""
         bones = []
 
-        for bone in list(arm_data.edit_bones):
-            arm_data.edit_bones.remove(bone)
+        eb = arm_data.edit_bones
+        for bone in list(eb):
+            eb.remove(bone)
 
         segments = 5
         for i in range(segments):
-            bone = arm_data.edit_bones.new(f"Bone.{i:03d}")
+            bone = eb.new(f"Bone.{i:03d}")
             bone.head = (0, 0, base_z + (height / segments) * i)
             bone.tail = (0, 0, base_z + (height / segments) * (i + 1))
             if i > 0:
-                bone.parent = arm_data.edit_bones[f"Bone.{i-1:03d}"]
+                bone.parent = eb[f"Bone.{i-1:03d}"]
             bones.append(f"Bone.{i:03d}")
 
         return bones
@@ -3494,22 +3632,18 @@ class BlenderForgeServer:
     def auto_weight_paint(self, mesh_name, armature_name):
         """Automatically paint weights"""
         try:
-            mesh_obj = bpy.data.objects.get(mesh_name)
-            armature_obj = bpy.data.objects.get(armature_name)
-
-            if not mesh_obj:
-                return {"error": f"Mesh '{mesh_name}' not found"}
-            if not armature_obj:
-                return {"error": f"Armature '{armature_name}' not found"}
+            mesh_obj, error = self._resolve_object(mesh_name, label="Mesh")
+            if error:
+                return error
+            armature_obj, error = self._resolve_object(armature_name, label="Armature")
+            if error:
+                return error
 
             # Clear existing weights
             mesh_obj.vertex_groups.clear()
 
             # Parent with automatic weights
-            bpy.ops.object.select_all(action='DESELECT')
-            mesh_obj.select_set(True)
-            armature_obj.select_set(True)
-            bpy.context.view_layer.objects.active = armature_obj
+            self._select_only([mesh_obj, armature_obj], armature_obj)
             bpy.ops.object.parent_set(type='ARMATURE_AUTO')
 
             return {
@@ -3523,48 +3657,52 @@ class BlenderForgeServer:
     def add_ik_controls(self, armature_name, limb_type="all"):
         """Add IK controls to armature"""
         try:
-            armature_obj = bpy.data.objects.get(armature_name)
-            if not armature_obj:
-                return {"error": f"Armature '{armature_name}' not found"}
-            if armature_obj.type != 'ARMATURE':
-                return {"error": f"Object '{armature_name}' is not an armature"}
+            armature_obj, error = self._resolve_object(armature_name, 'ARMATURE', label="Armature")
+            if error:
+                return error
 
             ik_targets = []
             bpy.context.view_layer.objects.active = armature_obj
-            bpy.ops.object.mode_set(mode='POSE')
 
             arm_data = armature_obj.data
 
-            # Find end bones and add IK
-            for bone in armature_obj.pose.bones:
+            # Find end bones up front; rest-pose bone data is readable in any
+            # mode, so each mode below only has to be entered once
+            pending = []
+            for bone in arm_data.bones:
                 should_add_ik = False
+                name_lower = bone.name.lower()
 
                 if limb_type == "all":
-                    should_add_ik = any(x in bone.name.lower() for x in ["hand", "foot", "paw"])
+                    should_add_ik = any(x in name_lower for x in ["hand", "foot", "paw"])
                 elif limb_type == "arms":
-                    should_add_ik = "hand" in bone.name.lower()
+                    should_add_ik = "hand" in name_lower
                 elif limb_type == "legs":
-                    should_add_ik = any(x in bone.name.lower() for x in ["foot", "paw"])
+                    should_add_ik = any(x in name_lower for x in ["foot", "paw"])
 
                 if should_add_ik:
-                    # Add IK constraint
-                    ik = bone.constraints.new('IK')
+                    pending.append((bone.name, bone.tail_local.copy()))
+
+            if pending:
+                # Create all IK target bones in one edit-mode pass
+                bpy.ops.object.mode_set(mode='EDIT')
+                edit_bones = arm_data.edit_bones
+                targets = []
+                for bone_name, tail in pending:
+                    target_bone = edit_bones.new(f"IK_Target_{bone_name}")
+                    target_bone.head = tail
+                    target_bone.tail = (tail[0], tail[1] - 0.1, tail[2])
+                    targets.append((bone_name, target_bone.name))
+
+                # Add the IK constraints in one pose-mode pass
+                bpy.ops.object.mode_set(mode='POSE')
+                pose_bones = armature_obj.pose.bones
+                for bone_name, target_name in targets:
+                    ik = pose_bones[bone_name].constraints.new('IK')
                     ik.chain_count = 2
-
-                    # Create IK target
-                    bpy.ops.object.mode_set(mode='EDIT')
-                    target_bone = arm_data.edit_bones.new(f"IK_Target_{bone.name}")
-                    target_bone.head = arm_data.edit_bones[bone.name].tail
-                    target_bone.tail = (
-                        target_bone.head[0],
-                        target_bone.head[1] - 0.1,
-                        target_bone.head[2]
-                    )
-                    bpy.ops.object.mode_set(mode='POSE')
-
                     ik.target = armature_obj
-                    ik.subtarget = target_bone.name
-                    ik_targets.append(target_bone.name)
+                    ik.subtarget = target_name
+                    ik_targets.append(target_name)
 
             bpy.ops.object.mode_set(mode='OBJECT')
 
@@ -3579,6 +3717,13 @@ class BlenderForgeServer:
     # endregion
 
 
+# Info lines shown under the telemetry toggle in the addon preferences
+_PREF_INFO_LINES = (
+    "All data is anonymized and helps improve Blender MCP.",
+    "You can opt out anytime by unchecking the box above.",
+)
+
+
 # Blender Addon Preferences
 class BLENDERFORGE_AddonPreferences(bpy.types.AddonPreferences):
     bl_idname = __name__
@@ -3601,8 +3746,8 @@ class BLENDERFORGE_AddonPreferences(bpy.types.AddonPreferences):
 
         # Info text
         box.separator()
-        box.label(text="All data is anonymized and helps improve Blender MCP.", icon="INFO")
-        box.label(text="You can opt out anytime by unchecking the box above.", icon="INFO")
+        for line in _PREF_INFO_LINES:
+            box.label(text=line, icon="INFO")
 
         # Terms and Conditions link
         box.separator()
@@ -3610,6 +3755,30 @@ class BLENDERFORGE_AddonPreferences(bpy.types.AddonPreferences):
         row.operator("blendermcp.open_terms", text="View Terms and Conditions", icon="TEXT")
 
 
+# (scene property, label) pairs drawn by the panel for each integration's settings
+_HYPER3D_PROPS = (
+    ("blenderforge_hyper3d_mode", "Rodin Mode"),
+    ("blenderforge_hyper3d_api_key", "API Key"),
+)
+
+_SKETCHFAB_PROPS = (("blenderforge_sketchfab_api_key", "API Key"),)
+
+# Hunyuan3D mode -> settings shown for that mode
+_HUNYUAN_MODE_PROPS = {
+    "OFFICIAL_API": (
+        ("blenderforge_hunyuan3d_secret_id", "SecretId"),
+        ("blenderforge_hunyuan3d_secret_key", "SecretKey"),
+    ),
+    "LOCAL_API": (
+        ("blenderforge_hunyuan3d_api_url", "API URL"),
+        ("blenderforge_hunyuan3d_octree_resolution", "Octree Resolution"),
+        ("blenderforge_hunyuan3d_num_inference_steps", "Number of Inference Steps"),
+        ("blenderforge_hunyuan3d_guidance_scale", "Guidance Scale"),
+        ("blenderforge_hunyuan3d_texture", "Generate Texture"),
+    ),
+}
+
+
 # Blender UI Panel
 class BLENDERFORGE_PT_Panel(bpy.types.Panel):
     bl_label = "Blender MCP"
@@ -3624,45 +3793,78 @@ class BLENDERFORGE_PT_Panel(bpy.types.Panel):
 
         layout.prop(scene, "blenderforge_port")
         layout.prop(scene, "blenderforge_use_polyhaven", text="Use assets from Poly Haven")
-
         layout.prop(scene, "blenderforge_use_hyper3d", text="Use Hyper3D Rodin 3D model generation")
-        if scene.blenderforge_use_hyper3d:
-            layout.prop(scene, "blenderforge_hyper3d_mode", text="Rodin Mode")
-            layout.prop(scene, "blenderforge_hyper3d_api_key", text="API Key")
-            layout.operator(
-                "blendermcp.set_hyper3d_free_trial_api_key", text="Set Free Trial API Key"
-            )
-
         layout.prop(scene, "blenderforge_use_sketchfab", text="Use assets from Sketchfab")
-        if scene.blenderforge_use_sketchfab:
-            layout.prop(scene, "blenderforge_sketchfab_api_key", text="API Key")
-
         layout.prop(
             scene, "blenderforge_use_hunyuan3d", text="Use Tencent Hunyuan 3D model generation"
         )
-        if scene.blenderforge_use_hunyuan3d:
-            layout.prop(scene, "blenderforge_hunyuan3d_mode", text="Hunyuan3D Mode")
-            if scene.blenderforge_hunyuan3d_mode == "OFFICIAL_API":
-                layout.prop(scene, "blenderforge_hunyuan3d_secret_id", text="SecretId")
-                layout.prop(scene, "blenderforge_hunyuan3d_secret_key", text="SecretKey")
-            if scene.blenderforge_hunyuan3d_mode == "LOCAL_API":
-                layout.prop(scene, "blenderforge_hunyuan3d_api_url", text="API URL")
-                layout.prop(
-                    scene, "blenderforge_hunyuan3d_octree_resolution", text="Octree Resolution"
-                )
-                layout.prop(
-                    scene,
-                    "blenderforge_hunyuan3d_num_inference_steps",
-                    text="Number of Inference Steps",
-                )
-                layout.prop(scene, "blenderforge_hunyuan3d_guidance_scale", text="Guidance Scale")
-                layout.prop(scene, "blenderforge_hunyuan3d_texture", text="Generate Texture")
 
         if not scene.blenderforge_server_running:
             layout.operator("blendermcp.start_server", text="Connect to MCP server")
         else:
             layout.operator("blendermcp.stop_server", text="Disconnect from MCP server")
-            layout.label(text=f"Running on port {scene.blenderforge_port}")
+            layout.label(text=_running_label or f"Running on port {scene.blenderforge_port}")
+
+
+# Integration settings live in child panels: Blender only calls their draw()
+# while poll() passes, so disabled integrations cost nothing per redraw
+class BLENDERFORGE_PT_Hyper3D(bpy.types.Panel):
+    bl_label = "Hyper3D Rodin"
+    bl_idname = "BLENDERFORGE_PT_Hyper3D"
+    bl_parent_id = "BLENDERFORGE_PT_Panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.blenderforge_use_hyper3d
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+
+        for prop, text in _HYPER3D_PROPS:
+            layout.prop(scene, prop, text=text)
+        layout.operator("blendermcp.set_hyper3d_free_trial_api_key", text="Set Free Trial API Key")
+
+
+class BLENDERFORGE_PT_Sketchfab(bpy.types.Panel):
+    bl_label = "Sketchfab"
+    bl_idname = "BLENDERFORGE_PT_Sketchfab"
+    bl_parent_id = "BLENDERFORGE_PT_Panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.blenderforge_use_sketchfab
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+
+        for prop, text in _SKETCHFAB_PROPS:
+            layout.prop(scene, prop, text=text)
+
+
+class BLENDERFORGE_PT_Hunyuan3D(bpy.types.Panel):
+    bl_label = "Hunyuan 3D"
+    bl_idname = "BLENDERFORGE_PT_Hunyuan3D"
+    bl_parent_id = "BLENDERFORGE_PT_Panel"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+
+    @classmethod
+    def poll(cls, context):
+        return context.scene.blenderforge_use_hunyuan3d
+
+    def draw(self, context):
+        layout = self.layout
+        scene = context.scene
+
+        layout.prop(scene, "blenderforge_hunyuan3d_mode", text="Hunyuan3D Mode")
+        for prop, text in _HUNYUAN_MODE_PROPS.get(scene.blenderforge_hunyuan3d_mode, ()):
+            layout.prop(scene, prop, text=text)
 
 
 # Operator to guide user to get Hyper3D API Key
@@ -3672,7 +3874,6 @@ class BLENDERFORGE_OT_SetFreeTrialHyper3DAPIKey(bpy.types.Operator):
     bl_description = "Opens Hyper3D website to get your API key"
 
     def execute(self, context):
-        import webbrowser
         # Check for environment variable first
         env_key = get_rodin_api_key()
         if env_key:
@@ -3693,14 +3894,16 @@ class BLENDERFORGE_OT_StartServer(bpy.types.Operator):
     bl_description = "Start the BlenderForge server to connect with Claude"
 
     def execute(self, context):
+        global _server, _running_label
         scene = context.scene
 
         # Create a new server instance
-        if not hasattr(bpy.types, "blenderforge_server") or not bpy.types.blenderforge_server:
-            bpy.types.blenderforge_server = BlenderForgeServer(port=scene.blenderforge_port)
+        if _server is None:
+            _server = BlenderForgeServer(port=scene.blenderforge_port)
 
         # Start the server
-        bpy.types.blenderforge_server.start()
+        _server.start()
+        _running_label = f"Running on port {_server.port}"
         scene.blenderforge_server_running = True
 
         return {"FINISHED"}
@@ -3713,12 +3916,14 @@ class BLENDERFORGE_OT_StopServer(bpy.types.Operator):
     bl_description = "Stop the connection to Claude"
 
     def execute(self, context):
+        global _server, _running_label
         scene = context.scene
 
         # Stop the server if it exists
-        if hasattr(bpy.types, "blenderforge_server") and bpy.types.blenderforge_server:
-            bpy.types.blenderforge_server.stop()
-            del bpy.types.blenderforge_server
+        if _server is not None:
+            _server.stop()
+            _server = None
+        _running_label = ""
 
         scene.blenderforge_server_running = False
 
@@ -3735,8 +3940,6 @@ class BLENDERFORGE_OT_OpenTerms(bpy.types.Operator):
         # Open the Terms and Conditions on GitHub
         terms_url = "https://github.com/ahujasid/blender-mcp/blob/main/TERMS_AND_CONDITIONS.md"
         try:
-            import webbrowser
-
             webbrowser.open(terms_url)
             self.report({"INFO"}, "Terms and Conditions opened in browser")
         except Exception as e:
@@ -3745,163 +3948,220 @@ class BLENDERFORGE_OT_OpenTerms(bpy.types.Operator):
         return {"FINISHED"}
 
 
-# Registration functions
-def register():
-    bpy.types.Scene.blenderforge_port = IntProperty(
-        name="Port",
-        description="Port for the BlenderForge server",
-        default=9876,
-        min=1024,
-        max=65535,
-    )
-
-    bpy.types.Scene.blenderforge_server_running = bpy.props.BoolProperty(
-        name="Server Running", default=False
-    )
-
-    bpy.types.Scene.blenderforge_use_polyhaven = bpy.props.BoolProperty(
-        name="Use Poly Haven", description="Enable Poly Haven asset integration", default=False
-    )
-
-    bpy.types.Scene.blenderforge_use_hyper3d = bpy.props.BoolProperty(
-        name="Use Hyper3D Rodin",
-        description="Enable Hyper3D Rodin generatino integration",
-        default=False,
-    )
-
-    bpy.types.Scene.blenderforge_hyper3d_mode = bpy.props.EnumProperty(
-        name="Rodin Mode",
-        description="Choose the platform used to call Rodin APIs",
-        items=[
-            ("MAIN_SITE", "hyper3d.ai", "hyper3d.ai"),
-            ("FAL_AI", "fal.ai", "fal.ai"),
-        ],
-        default="MAIN_SITE",
-    )
-
-    bpy.types.Scene.blenderforge_hyper3d_api_key = bpy.props.StringProperty(
-        name="Hyper3D API Key",
-        subtype="PASSWORD",
-        description="API Key provided by Hyper3D",
-        default="",
-    )
-
-    bpy.types.Scene.blenderforge_use_hunyuan3d = bpy.props.BoolProperty(
-        name="Use Hunyuan 3D", description="Enable Hunyuan asset integration", default=False
-    )
-
-    bpy.types.Scene.blenderforge_hunyuan3d_mode = bpy.props.EnumProperty(
-        name="Hunyuan3D Mode",
-        description="Choose a local or official APIs",
-        items=[
-            ("LOCAL_API", "local api", "local api"),
-            ("OFFICIAL_API", "official api", "official api"),
-        ],
-        default="LOCAL_API",
-    )
-
-    bpy.types.Scene.blenderforge_hunyuan3d_secret_id = bpy.props.StringProperty(
-        name="Hunyuan 3D SecretId", description="SecretId provided by Hunyuan 3D", default=""
-    )
-
-    bpy.types.Scene.blenderforge_hunyuan3d_secret_key = bpy.props.StringProperty(
-        name="Hunyuan 3D SecretKey",
-        subtype="PASSWORD",
-        description="SecretKey provided by Hunyuan 3D",
-        default="",
-    )
-
-    bpy.types.Scene.blenderforge_hunyuan3d_api_url = bpy.props.StringProperty(
-        name="API URL",
-        description="URL of the Hunyuan 3D API service",
-        default="http://localhost:8081",
-    )
-
-    bpy.types.Scene.blenderforge_hunyuan3d_octree_resolution = bpy.props.IntProperty(
-        name="Octree Resolution",
-        description="Octree resolution for the 3D generation",
-        default=256,
-        min=128,
-        max=512,
-    )
+# Scene properties registered by the addon: (attribute name, property type, keyword arguments)
+_SCENE_PROPS = (
+    (
+        "blenderforge_port",
+        IntProperty,
+        {
+            "name": "Port",
+            "description": "Port for the BlenderForge server",
+            "default": 9876,
+            "min": 1024,
+            "max": 65535,
+        },
+    ),
+    ("blenderforge_server_running", BoolProperty, {"name": "Server Running", "default": False}),
+    (
+        "blenderforge_use_polyhaven",
+        BoolProperty,
+        {
+            "name": "Use Poly Haven",
+            "description": "Enable Poly Haven asset integration",
+            "default": False,
+        },
+    ),
+    (
+        "blenderforge_use_hyper3d",
+        BoolProperty,
+        {
+            "name": "Use Hyper3D Rodin",
+            "description": "Enable Hyper3D Rodin generatino integration",
+            "default": False,
+        },
+    ),
+    (
+        "blenderforge_hyper3d_mode",
+        EnumProperty,
+        {
+            "name": "Rodin Mode",
+            "description": "Choose the platform used to call Rodin APIs",
+            "items": [
+                ("MAIN_SITE", "hyper3d.ai", "hyper3d.ai"),
+                ("FAL_AI", "fal.ai", "fal.ai"),
+            ],
+            "default": "MAIN_SITE",
+        },
+    ),
+    (
+        "blenderforge_hyper3d_api_key",
+        StringProperty,
+        {
+            "name": "Hyper3D API Key",
+            "subtype": "PASSWORD",
+            "description": "API Key provided by Hyper3D",
+            "default": "",
+        },
+    ),
+    (
+        "blenderforge_use_hunyuan3d",
+        BoolProperty,
+        {
+            "name": "Use Hunyuan 3D",
+            "description": "Enable Hunyuan asset integration",
+            "default": False,
+        },
+    ),
+    (
+        "blenderforge_hunyuan3d_mode",
+        EnumProperty,
+        {
+            "name": "Hunyuan3D Mode",
+            "description": "Choose a local or official APIs",
+            "items": [
+                ("LOCAL_API", "local api", "local api"),
+                ("OFFICIAL_API", "official api", "official api"),
+            ],
+            "default": "LOCAL_API",
+        },
+    ),
+    (
+        "blenderforge_hunyuan3d_secret_id",
+        StringProperty,
+        {
+            "name": "Hunyuan 3D SecretId",
+            "description": "SecretId provided by Hunyuan 3D",
+            "default": "",
+        },
+    ),
+    (
+        "blenderforge_hunyuan3d_secret_key",
+        StringProperty,
+        {
+            "name": "Hunyuan 3D SecretKey",
+            "subtype": "PASSWORD",
+            "description": "SecretKey provided by Hunyuan 3D",
+            "default": "",
+        },
+    ),
+    (
+        "blenderforge_hunyuan3d_api_url",
+        StringProperty,
+        {
+            "name": "API URL",
+            "description": "URL of the Hunyuan 3D API service",
+            "default": "http://localhost:8081",
+        },
+    ),
+    (
+        "blenderforge_hunyuan3d_octree_resolution",
+        IntProperty,
+        {
+            "name": "Octree Resolution",
+            "description": "Octree resolution for the 3D generation",
+            "default": 256,
+            "min": 128,
+            "max": 512,
+        },
+    ),
+    (
+        "blenderforge_hunyuan3d_num_inference_steps",
+        IntProperty,
+        {
+            "name": "Number of Inference Steps",
+            "description": "Number of inference steps for the 3D generation",
+            "default": 20,
+            "min": 20,
+            "max": 50,
+        },
+    ),
+    (
+        "blenderforge_hunyuan3d_guidance_scale",
+        FloatProperty,
+        {
+            "name": "Guidance Scale",
+            "description": "Guidance scale for the 3D generation",
+            "default": 5.5,
+            "min": 1.0,
+            "max": 10.0,
+        },
+    ),
+    (
+        "blenderforge_hunyuan3d_texture",
+        BoolProperty,
+        {
+            "name": "Generate Texture",
+            "description": "Whether to generate texture for the 3D model",
+            "default": False,
+        },
+    ),
+    (
+        "blenderforge_use_sketchfab",
+        BoolProperty,
+        {
+            "name": "Use Sketchfab",
+            "description": "Enable Sketchfab asset integration",
+            "default": False,
+        },
+    ),
+    (
+        "blenderforge_sketchfab_api_key",
+        StringProperty,
+        {
+            "name": "Sketchfab API Key",
+            "subtype": "PASSWORD",
+            "description": "API Key provided by Sketchfab",
+            "default": "",
+        },
+    ),
+)
+
+
+# Classes registered by the addon; child panels must follow their parent.
+# unregister runs in reverse order.
+_classes = (
+    BLENDERFORGE_AddonPreferences,
+    BLENDERFORGE_PT_Panel,
+    BLENDERFORGE_PT_Hyper3D,
+    BLENDERFORGE_PT_Sketchfab,
+    BLENDERFORGE_PT_Hunyuan3D,
+    BLENDERFORGE_OT_SetFreeTrialHyper3DAPIKey,
+    BLENDERFORGE_OT_StartServer,
+    BLENDERFORGE_OT_StopServer,
+    BLENDERFORGE_OT_OpenTerms,
+)
+
+_register_classes, _unregister_classes = bpy.utils.register_classes_factory(_classes)
 
-    bpy.types.Scene.blenderforge_hunyuan3d_num_inference_steps = bpy.props.IntProperty(
-        name="Number of Inference Steps",
-        description="Number of inference steps for the 3D generation",
-        default=20,
-        min=20,
-        max=50,
-    )
 
-    bpy.types.Scene.blenderforge_hunyuan3d_guidance_scale = bpy.props.FloatProperty(
-        name="Guidance Scale",
-        description="Guidance scale for the 3D generation",
-        default=5.5,
-        min=1.0,
-        max=10.0,
-    )
+# Registration functions
+def register():
+    for name, prop_type, kwargs in _SCENE_PROPS:
+        setattr(bpy.types.Scene, name, prop_type(**kwargs))
 
-    bpy.types.Scene.blenderforge_hunyuan3d_texture = bpy.props.BoolProperty(
-        name="Generate Texture",
-        description="Whether to generate texture for the 3D model",
-        default=False,
-    )
+    _register_classes()
 
-    bpy.types.Scene.blenderforge_use_sketchfab = bpy.props.BoolProperty(
-        name="Use Sketchfab", description="Enable Sketchfab asset integration", default=False
-    )
+    if _DEBUG:
+        print("BlenderForge addon registered")
 
-    bpy.types.Scene.blenderforge_sketchfab_api_key = bpy.props.StringProperty(
-        name="Sketchfab API Key",
-        subtype="PASSWORD",
-        description="API Key provided by Sketchfab",
-        default="",
-    )
 
-    # Register preferences class
-    bpy.utils.register_class(BLENDERFORGE_AddonPreferences)
+def unregister():
+    global _server, _running_label
 
-    bpy.utils.register_class(BLENDERFORGE_PT_Panel)
-    bpy.utils.register_class(BLENDERFORGE_OT_SetFreeTrialHyper3DAPIKey)
-    bpy.utils.register_class(BLENDERFORGE_OT_StartServer)
-    bpy.utils.register_class(BLENDERFORGE_OT_StopServer)
-    bpy.utils.register_class(BLENDERFORGE_OT_OpenTerms)
+    # Stop the server if it's running
+    if _server is not None:
+        _server.stop()
+        _server = None
+    _running_label = ""
 
-    print("BlenderForge addon registered")
+    _unregister_classes()
+    get_rodin_api_key.cache_clear()
 
+    for name, _prop_type, _kwargs in _SCENE_PROPS:
+        delattr(bpy.types.Scene, name)
 
-def unregister():
-    # Stop the server if it's running
-    if hasattr(bpy.types, "blenderforge_server") and bpy.types.blenderforge_server:
-        bpy.types.blenderforge_server.stop()
-        del bpy.types.blenderforge_server
-
-    bpy.utils.unregister_class(BLENDERFORGE_PT_Panel)
-    bpy.utils.unregister_class(BLENDERFORGE_OT_SetFreeTrialHyper3DAPIKey)
-    bpy.utils.unregister_class(BLENDERFORGE_OT_StartServer)
-    bpy.utils.unregister_class(BLENDERFORGE_OT_StopServer)
-    bpy.utils.unregister_class(BLENDERFORGE_OT_OpenTerms)
-    bpy.utils.unregister_class(BLENDERFORGE_AddonPreferences)
-
-    del bpy.types.Scene.blenderforge_port
-    del bpy.types.Scene.blenderforge_server_running
-    del bpy.types.Scene.blenderforge_use_polyhaven
-    del bpy.types.Scene.blenderforge_use_hyper3d
-    del bpy.types.Scene.blenderforge_hyper3d_mode
-    del bpy.types.Scene.blenderforge_hyper3d_api_key
-    del bpy.types.Scene.blenderforge_use_sketchfab
-    del bpy.types.Scene.blenderforge_sketchfab_api_key
-    del bpy.types.Scene.blenderforge_use_hunyuan3d
-    del bpy.types.Scene.blenderforge_hunyuan3d_mode
-    del bpy.types.Scene.blenderforge_hunyuan3d_secret_id
-    del bpy.types.Scene.blenderforge_hunyuan3d_secret_key
-    del bpy.types.Scene.blenderforge_hunyuan3d_api_url
-    del bpy.types.Scene.blenderforge_hunyuan3d_octree_resolution
-    del bpy.types.Scene.blenderforge_hunyuan3d_num_inference_steps
-    del bpy.types.Scene.blenderforge_hunyuan3d_guidance_scale
-    del bpy.types.Scene.blenderforge_hunyuan3d_texture
-
-    print("BlenderForge addon unregistered")
+    if _DEBUG:
+        print("BlenderForge addon unregistered")
 
 
 if __name__ == "__main__":
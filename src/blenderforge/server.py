@@ -9,15 +9,25 @@ import logging
 import os
 import socket
 import tempfile
+import time
 from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 from urllib.parse import urlparse
 
 from mcp.server.fastmcp import Context, FastMCP, Image
 
+# Optional faster JSON encoder/decoder for the Blender socket
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
 # Import telemetry
 from .telemetry import record_startup
 from .telemetry_decorator import telemetry_tool
@@ -32,6 +42,24 @@ logger = logging.getLogger("BlenderForgeServer")
 DEFAULT_HOST = "localhost"
 DEFAULT_PORT = 9876
 
+# Responses are requested with an 8-byte big-endian length prefix so they can be read
+# in one pass. Addons that predate framing ignore the request and send bare JSON.
+RESPONSE_FRAMING = "length"
+RESPONSE_HEADER_SIZE = 8
+
+# Insignificant whitespace that may trail a bare JSON response
+_JSON_WHITESPACE = b" \t\r\n"
+
+# Screenshots and scene dumps can be megabytes; read them in large chunks and give
+# the kernel room to buffer them so the receive loop makes fewer syscalls.
+RECV_CHUNK_SIZE = 64 * 1024
+SOCKET_BUFFER_SIZE = 1 << 20
+
+# Timeout for establishing the connection, then for every send/receive on it.
+# The response timeout matches the addon's and is set once per connection.
+CONNECT_TIMEOUT = 10.0
+RESPONSE_TIMEOUT = 180.0
+
 # Security configuration
 CODE_EXECUTION_ENABLED = os.getenv("BLENDERFORGE_ALLOW_CODE_EXECUTION", "true").lower() == "true"
 
@@ -53,63 +81,108 @@ DANGEROUS_CODE_PATTERNS = [
     r"\bhttp\b",
 ]
 
+# All dangerous patterns compiled into one alternation so code is scanned once.
+# Each pattern gets a named group (p0, p1, ...) to report which one matched.
+_DANGEROUS_RE = re.compile(
+    "|".join(f"(?P<p{i}>{pattern})" for i, pattern in enumerate(DANGEROUS_CODE_PATTERNS)),
+    re.IGNORECASE,
+)
+
+# Import statements at the start of any line, matched across the whole code at once:
+# "from X import Y" captures X as from_module, "import X" captures X as import_module.
+# [^\S\n] is whitespace other than a newline, so a match never spans lines.
+_IMPORT_LINE_RE = re.compile(
+    r"^[^\S\n]*(?:from[^\S\n]+(?P<from_module>\w+(?:\.\w+)*)[^\S\n]+import"
+    r"|import[^\S\n]+(?P<import_module>\w+(?:\.\w+)*))",
+    re.MULTILINE,
+)
+
 # Allowed safe imports for code execution
-ALLOWED_IMPORTS = {
+ALLOWED_IMPORTS: frozenset[str] = frozenset({
     "bpy", "bmesh", "mathutils", "math", "random", "json", "re",
     "collections", "itertools", "functools", "typing",
-}
+})
+
+# Allow-list as shown in import rejection messages
+_ALLOWED_IMPORTS_DISPLAY = ", ".join(sorted(ALLOWED_IMPORTS))
+
+
+# Larger snippets are validated without caching so the cache cannot pin huge strings
+VALIDATION_CACHE_MAX_CODE_SIZE = 64 * 1024
 
 
 def validate_code_security(code: str) -> tuple[bool, str]:
     """
     Validate code for potentially dangerous patterns.
 
+    Results for snippets up to VALIDATION_CACHE_MAX_CODE_SIZE characters are
+    cached, since agents often resend the same code.
+
     Returns:
         Tuple of (is_safe, error_message)
     """
     if not CODE_EXECUTION_ENABLED:
         return False, "Code execution is disabled. Set BLENDERFORGE_ALLOW_CODE_EXECUTION=true to enable."
 
+    if len(code) > VALIDATION_CACHE_MAX_CODE_SIZE:
+        return _scan_code(code)
+    return _scan_code_cached(code)
+
+
+def _scan_code(code: str) -> tuple[bool, str]:
+    """Check code against the dangerous patterns and the import allow-list."""
     # Check for dangerous patterns
-    for pattern in DANGEROUS_CODE_PATTERNS:
-        if re.search(pattern, code, re.IGNORECASE):
-            return False, f"Code contains potentially dangerous pattern: {pattern}"
+    match = _DANGEROUS_RE.search(code)
+    if match:
+        pattern = DANGEROUS_CODE_PATTERNS[int(match.lastgroup[1:])]
+        return False, f"Code contains potentially dangerous pattern: {pattern}"
 
     # Check for suspicious imports
     # We only care about the base module, not what's imported from it
     # "from collections import defaultdict" -> check "collections" (allowed)
     # "import os" -> check "os" (not allowed)
-
-    # Pattern for "from X import Y" - capture the module X
-    from_pattern = r"^\s*from\s+(\w+(?:\.\w+)*)\s+import"
-    # Pattern for "import X" at start of line - capture the module X
-    import_pattern = r"^\s*import\s+(\w+(?:\.\w+)*)"
-
-    for line in code.split("\n"):
-        line = line.strip()
-        if not line or line.startswith("#"):
-            continue
-
-        # Check "from X import" pattern
-        from_match = re.match(from_pattern, line)
-        if from_match:
-            module = from_match.group(1)
-            base_module = module.split(".")[0]
-            if base_module not in ALLOWED_IMPORTS:
-                return False, f"Import from '{module}' is not allowed. Allowed: {', '.join(sorted(ALLOWED_IMPORTS))}"
+    for match in _IMPORT_LINE_RE.finditer(code):
+        module = match.group("from_module")
+        if module is not None:
+            # Check "from X import" pattern
+            if module.split(".")[0] not in ALLOWED_IMPORTS:
+                return False, f"Import from '{module}' is not allowed. Allowed: {_ALLOWED_IMPORTS_DISPLAY}"
             continue
 
         # Check "import X" pattern
-        import_match = re.match(import_pattern, line)
-        if import_match:
-            module = import_match.group(1)
-            base_module = module.split(".")[0]
-            if base_module not in ALLOWED_IMPORTS:
-                return False, f"Import of '{module}' is not allowed. Allowed: {', '.join(sorted(ALLOWED_IMPORTS))}"
+        module = match.group("import_module")
+        if module.split(".")[0] not in ALLOWED_IMPORTS:
+            return False, f"Import of '{module}' is not allowed. Allowed: {_ALLOWED_IMPORTS_DISPLAY}"
 
     return True, ""
 
 
+_scan_code_cached = lru_cache(maxsize=256)(_scan_code)
+
+
+def _json_dumps(obj: Any) -> bytes:
+    """Serialize obj to UTF-8 JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            # orjson is stricter (e.g. non-str keys, >64-bit ints); let json decide
+            pass
+    return json.dumps(obj).encode("utf-8")
+
+
+def _json_loads(data: bytes | bytearray) -> Any:
+    """Parse UTF-8 JSON bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity, which the addon's json.dumps emits for
+            # degenerate float data; let json decide
+            pass
+    return json.loads(data)
+
+
 @dataclass
 class BlenderConnection:
     host: str
@@ -129,8 +202,15 @@ class BlenderConnection:
         for attempt in range(max_attempts):
             try:
                 self.sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                self.sock.settimeout(10.0)  # Connection timeout
+                self.sock.settimeout(CONNECT_TIMEOUT)
+                # Size the buffers before connecting so the TCP window is negotiated with them
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE)
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE)
                 self.sock.connect((self.host, self.port))
+                # The socket keeps this timeout for its lifetime; nothing else changes it
+                self.sock.settimeout(RESPONSE_TIMEOUT)
+                # Commands are small request/response RPCs; don't let Nagle hold them back
+                self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
 
                 # Try to get auth token from environment
                 self.auth_token = os.getenv("BLENDERFORGE_AUTH_TOKEN")
@@ -150,8 +230,6 @@ class BlenderConnection:
                 self.sock = None
 
             if attempt < max_attempts - 1:
-                import time
-
                 time.sleep(self.retry_delay)
 
         logger.error(f"Failed to connect to Blender after {max_attempts} attempts")
@@ -167,11 +245,39 @@ class BlenderConnection:
             finally:
                 self.sock = None
 
-    def receive_full_response(self, sock, buffer_size=8192):
-        """Receive the complete response, potentially in multiple chunks"""
-        chunks = []
-        # Use a consistent timeout value that matches the addon's timeout
-        sock.settimeout(180.0)  # Match the addon's timeout
+    def _receive_framed_payload(self, sock, received: bytes) -> bytearray:
+        """Read a length-prefixed response given at least its header.
+
+        The payload is received straight into a buffer of the announced size,
+        so each byte is copied once and no partial JSON is ever parsed.
+        """
+        length = int.from_bytes(received[:RESPONSE_HEADER_SIZE], "big")
+        payload = bytearray(length)
+        view = memoryview(payload)
+        initial = received[RESPONSE_HEADER_SIZE:RESPONSE_HEADER_SIZE + length]
+        view[: len(initial)] = initial
+        offset = len(initial)
+
+        while offset < length:
+            received_count = sock.recv_into(view[offset:])
+            if not received_count:
+                raise ConnectionError("Connection closed before the full response was received")
+            offset += received_count
+
+        logger.info(f"Received complete response ({length} bytes)")
+        return payload
+
+    def receive_full_response(self, sock, buffer_size=RECV_CHUNK_SIZE):
+        """Receive the complete response, potentially in multiple chunks
+
+        Framed responses start with a length header whose first byte is NUL for any
+        realistic size, which can never start a JSON document. Bare JSON from older
+        addons is received by probing for a complete JSON object instead.
+
+        The socket's timeout is left as is; connect() sets RESPONSE_TIMEOUT once.
+        """
+        # Accumulate into one growing buffer instead of re-joining every chunk per probe
+        buffer = bytearray()
 
         try:
             while True:
@@ -179,21 +285,34 @@ class BlenderConnection:
                     chunk = sock.recv(buffer_size)
                     if not chunk:
                         # If we get an empty chunk, the connection might be closed
-                        if not chunks:  # If we haven't received anything yet, this is an error
+                        if not buffer:  # If we haven't received anything yet, this is an error
                             raise Exception("Connection closed before receiving any data")
                         break
 
-                    chunks.append(chunk)
+                    buffer += chunk
+
+                    if buffer[:1] == b"\x00":
+                        # Length-prefixed response; wait until the header is complete
+                        if len(buffer) >= RESPONSE_HEADER_SIZE:
+                            return self._receive_framed_payload(sock, buffer)
+                        continue
+
+                    # A complete object or array ends in } or ]; anything else is still partial.
+                    # Judge by the buffer, not the chunk: the final chunk may be only whitespace.
+                    end = len(buffer)
+                    while end and buffer[end - 1] in _JSON_WHITESPACE:
+                        end -= 1
+                    if buffer[end - 1 : end] not in (b"}", b"]"):
+                        continue
 
                     # Check if we've received a complete JSON object
                     try:
-                        data = b"".join(chunks)
-                        json.loads(data.decode("utf-8"))
+                        _json_loads(buffer)
                         # If we get here, it parsed successfully
-                        logger.info(f"Received complete response ({len(data)} bytes)")
-                        return data
-                    except json.JSONDecodeError:
-                        # Incomplete JSON, continue receiving
+                        logger.info(f"Received complete response ({len(buffer)} bytes)")
+                        return buffer
+                    except (json.JSONDecodeError, UnicodeDecodeError):
+                        # Incomplete JSON (possibly split mid-character), continue receiving
                         continue
                 except TimeoutError:
                     # If we hit a timeout during receiving, break the loop and try to use what we have
@@ -210,14 +329,13 @@ class BlenderConnection:
 
         # If we get here, we either timed out or broke out of the loop
         # Try to use what we have
-        if chunks:
-            data = b"".join(chunks)
-            logger.info(f"Returning data after receive completion ({len(data)} bytes)")
+        if buffer:
+            logger.info(f"Returning data after receive completion ({len(buffer)} bytes)")
             try:
                 # Try to parse what we have
-                json.loads(data.decode("utf-8"))
-                return data
-            except json.JSONDecodeError:
+                _json_loads(buffer)
+                return buffer
+            except (json.JSONDecodeError, UnicodeDecodeError):
                 # If we can't parse it, it's incomplete
                 raise Exception("Incomplete JSON response received")
         else:
@@ -228,7 +346,7 @@ class BlenderConnection:
         if not self.sock and not self.connect():
             raise ConnectionError("Not connected to Blender")
 
-        command = {"type": command_type, "params": params or {}}
+        command = {"type": command_type, "params": params or {}, "framing": RESPONSE_FRAMING}
 
         # Include auth token if available
         if self.auth_token:
@@ -239,17 +357,14 @@ class BlenderConnection:
             logger.info(f"Sending command: {command_type} with params: {params}")
 
             # Send the command
-            self.sock.sendall(json.dumps(command).encode("utf-8"))
+            self.sock.sendall(_json_dumps(command))
             logger.info("Command sent, waiting for response...")
 
-            # Set a timeout for receiving - use the same timeout as in receive_full_response
-            self.sock.settimeout(180.0)  # Match the addon's timeout
-
             # Receive the response using the improved receive_full_response method
             response_data = self.receive_full_response(self.sock)
             logger.info(f"Received {len(response_data)} bytes of data")
 
-            response = json.loads(response_data.decode("utf-8"))
+            response = _json_loads(response_data)
             logger.info(f"Response parsed, status: {response.get('status', 'unknown')}")
 
             if response.get("status") == "error":
@@ -328,18 +443,31 @@ mcp = FastMCP("BlenderForge", lifespan=server_lifespan)
 _blender_connection = None
 _polyhaven_enabled = False  # Add this global variable
 
+# Minimum seconds between health-check pings on the persistent connection.
+# A connection that dies in between is re-established by send_command itself.
+PING_INTERVAL = 5.0
+_last_ping_time = 0.0
+
 
 def get_blender_connection():
     """Get or create a persistent Blender connection"""
-    global _blender_connection, _polyhaven_enabled  # Add _polyhaven_enabled to globals
+    global _blender_connection, _polyhaven_enabled, _last_ping_time
 
     # If we have an existing connection, check if it's still valid
     if _blender_connection is not None:
+        # Skip the ping round trip if the connection was verified recently and has
+        # not been dropped since (send_command clears sock after a socket error)
+        if (
+            _blender_connection.sock is not None
+            and time.monotonic() - _last_ping_time < PING_INTERVAL
+        ):
+            return _blender_connection
         try:
             # First check if PolyHaven is enabled by sending a ping command
             result = _blender_connection.send_command("get_polyhaven_status")
             # Store the PolyHaven status globally
             _polyhaven_enabled = result.get("enabled", False)
+            _last_ping_time = time.monotonic()
             return _blender_connection
         except Exception as e:
             # Connection is dead, close it and create a new one
@@ -410,12 +538,15 @@ def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
 
     Returns the screenshot as an Image.
     """
+    temp_path = None
     try:
         blender = get_blender_connection()
 
-        # Create temp file path
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, f"blender_screenshot_{os.getpid()}.png")
+        # Reserve a unique temp file so concurrent captures never share a path
+        with tempfile.NamedTemporaryFile(
+            prefix="blender_screenshot_", suffix=".png", delete=False
+        ) as temp_file:
+            temp_path = temp_file.name
 
         result = blender.send_command(
             "get_viewport_screenshot",
@@ -425,21 +556,24 @@ def get_viewport_screenshot(ctx: Context, max_size: int = 800) -> Image:
         if "error" in result:
             raise Exception(result["error"])
 
-        if not os.path.exists(temp_path):
+        # The reserved file starts empty; Blender overwrites it with the capture
+        if not os.path.getsize(temp_path):
             raise Exception("Screenshot file was not created")
 
         # Read the file
         with open(temp_path, "rb") as f:
             image_bytes = f.read()
 
-        # Delete the temp file
-        os.remove(temp_path)
-
         return Image(data=image_bytes, format="png")
 
     except Exception as e:
         logger.error(f"Error capturing screenshot: {str(e)}")
         raise Exception(f"Screenshot failed: {str(e)}")
+    finally:
+        # Delete the temp file, including when the capture failed
+        if temp_path is not None:
+            with suppress(OSError):
+                os.remove(temp_path)
 
 
 @telemetry_tool("execute_blender_code")
@@ -492,15 +626,15 @@ def get_polyhaven_categories(ctx: Context, asset_type: str = "hdris") -> str:
 
         # Format the categories in a more readable way
         categories = result["categories"]
-        formatted_output = f"Categories for {asset_type}:\n\n"
+        parts = [f"Categories for {asset_type}:\n\n"]
 
         # Sort categories by count (descending)
         sorted_categories = sorted(categories.items(), key=lambda x: x[1], reverse=True)
 
         for category, count in sorted_categories:
-            formatted_output += f"- {category}: {count} assets\n"
+            parts.append(f"- {category}: {count} assets\n")
 
-        return formatted_output
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error getting Polyhaven categories: {str(e)}")
         return f"Error getting Polyhaven categories: {str(e)}"
@@ -532,10 +666,10 @@ def search_polyhaven_assets(ctx: Context, asset_type: str = "all", categories: s
         total_count = result["total_count"]
         returned_count = result["returned_count"]
 
-        formatted_output = f"Found {total_count} assets"
+        parts = [f"Found {total_count} assets"]
         if categories:
-            formatted_output += f" in categories: {categories}"
-        formatted_output += f"\nShowing {returned_count} assets:\n\n"
+            parts.append(f" in categories: {categories}")
+        parts.append(f"\nShowing {returned_count} assets:\n\n")
 
         # Sort assets by download count (popularity)
         sorted_assets = sorted(
@@ -543,14 +677,12 @@ def search_polyhaven_assets(ctx: Context, asset_type: str = "all", categories: s
         )
 
         for asset_id, asset_data in sorted_assets:
-            formatted_output += f"- {asset_data.get('name', asset_id)} (ID: {asset_id})\n"
-            formatted_output += (
-                f"  Type: {['HDRI', 'Texture', 'Model'][asset_data.get('type', 0)]}\n"
-            )
-            formatted_output += f"  Categories: {', '.join(asset_data.get('categories', []))}\n"
-            formatted_output += f"  Downloads: {asset_data.get('download_count', 'Unknown')}\n\n"
+            parts.append(f"- {asset_data.get('name', asset_id)} (ID: {asset_id})\n")
+            parts.append(f"  Type: {['HDRI', 'Texture', 'Model'][asset_data.get('type', 0)]}\n")
+            parts.append(f"  Categories: {', '.join(asset_data.get('categories', []))}\n")
+            parts.append(f"  Downloads: {asset_data.get('download_count', 'Unknown')}\n\n")
 
-        return formatted_output
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error searching Polyhaven assets: {str(e)}")
         return f"Error searching Polyhaven assets: {str(e)}"
@@ -640,23 +772,24 @@ def set_texture(ctx: Context, object_name: str, texture_id: str) -> str:
             has_nodes = material_info.get("has_nodes", False)
             texture_nodes = material_info.get("texture_nodes", [])
 
-            output = f"Successfully applied texture '{texture_id}' to {object_name}.\n"
-            output += f"Using material '{material_name}' with maps: {maps}.\n\n"
-            output += f"Material has nodes: {has_nodes}\n"
-            output += f"Total node count: {node_count}\n\n"
+            parts = [
+                f"Successfully applied texture '{texture_id}' to {object_name}.\n"
+                f"Using material '{material_name}' with maps: {maps}.\n\n"
+                f"Material has nodes: {has_nodes}\n"
+                f"Total node count: {node_count}\n\n"
+            ]
 
             if texture_nodes:
-                output += "Texture nodes:\n"
+                parts.append("Texture nodes:\n")
                 for node in texture_nodes:
-                    output += f"- {node['name']} using image: {node['image']}\n"
+                    parts.append(f"- {node['name']} using image: {node['image']}\n")
                     if node["connections"]:
-                        output += "  Connections:\n"
-                        for conn in node["connections"]:
-                            output += f"    {conn}\n"
+                        parts.append("  Connections:\n")
+                        parts.extend(f"    {conn}\n" for conn in node["connections"])
             else:
-                output += "No texture nodes found in the material.\n"
+                parts.append("No texture nodes found in the material.\n")
 
-            return output
+            return "".join(parts)
         else:
             return f"Failed to apply texture: {result.get('message', 'Unknown error')}"
     except Exception as e:
@@ -664,6 +797,43 @@ def set_texture(ctx: Context, object_name: str, texture_id: str) -> str:
         return f"Error applying texture: {str(e)}"
 
 
+# Guidance appended to a status message when the integration is enabled
+_POLYHAVEN_SUFFIX = (
+    "PolyHaven is good at Textures, and has a wider variety of textures than Sketchfab."
+)
+_SKETCHFAB_SUFFIX = (
+    "Sketchfab is good at Realistic models, and has a wider variety of models than PolyHaven."
+)
+
+
+@telemetry_tool("get_integrations_status")
+@mcp.tool()
+def get_integrations_status(ctx: Context) -> str:
+    """
+    Check which asset integrations are enabled in Blender with a single request:
+    PolyHaven, Sketchfab, Hyper3D Rodin and Hunyuan3D.
+    Returns a JSON object with "enabled" and "message" for each integration.
+
+    Don't emphasize the key type in the returned messages, but silently remember it.
+    """
+    global _polyhaven_enabled
+    try:
+        blender = get_blender_connection()
+        result = blender.send_command("get_integrations_status")
+
+        suffixes = {"polyhaven": _POLYHAVEN_SUFFIX, "sketchfab": _SKETCHFAB_SUFFIX}
+        for name, suffix in suffixes.items():
+            status = result.get(name) or {}
+            if status.get("enabled", False):
+                status["message"] = f"{status.get('message', '')}{suffix}"
+
+        _polyhaven_enabled = (result.get("polyhaven") or {}).get("enabled", False)
+        return json.dumps(result, indent=2)
+    except Exception as e:
+        logger.error(f"Error checking integrations status: {str(e)}")
+        return f"Error checking integrations status: {str(e)}"
+
+
 @telemetry_tool("get_polyhaven_status")
 @mcp.tool()
 def get_polyhaven_status(ctx: Context) -> str:
@@ -671,16 +841,14 @@ def get_polyhaven_status(ctx: Context) -> str:
     Check if PolyHaven integration is enabled in Blender.
     Returns a message indicating whether PolyHaven features are available.
     """
+    global _polyhaven_enabled
     try:
         blender = get_blender_connection()
         result = blender.send_command("get_polyhaven_status")
-        enabled = result.get("enabled", False)
+        # Keep the cached flag in step so PolyHaven tools agree with what was just reported
+        _polyhaven_enabled = result.get("enabled", False)
         message = result.get("message", "")
-        if enabled:
-            message += (
-                "PolyHaven is good at Textures, and has a wider variety of textures than Sketchfab."
-            )
-        return message
+        return f"{message}{_POLYHAVEN_SUFFIX}" if _polyhaven_enabled else message
     except Exception as e:
         logger.error(f"Error checking PolyHaven status: {str(e)}")
         return f"Error checking PolyHaven status: {str(e)}"
@@ -698,11 +866,7 @@ def get_hyper3d_status(ctx: Context) -> str:
     try:
         blender = get_blender_connection()
         result = blender.send_command("get_hyper3d_status")
-        enabled = result.get("enabled", False)
-        message = result.get("message", "")
-        if enabled:
-            message += ""
-        return message
+        return result.get("message", "")
     except Exception as e:
         logger.error(f"Error checking Hyper3D status: {str(e)}")
         return f"Error checking Hyper3D status: {str(e)}"
@@ -718,11 +882,8 @@ def get_sketchfab_status(ctx: Context) -> str:
     try:
         blender = get_blender_connection()
         result = blender.send_command("get_sketchfab_status")
-        enabled = result.get("enabled", False)
         message = result.get("message", "")
-        if enabled:
-            message += "Sketchfab is good at Realistic models, and has a wider variety of models than PolyHaven."
-        return message
+        return f"{message}{_SKETCHFAB_SUFFIX}" if result.get("enabled", False) else message
     except Exception as e:
         logger.error(f"Error checking Sketchfab status: {str(e)}")
         return f"Error checking Sketchfab status: {str(e)}"
@@ -773,7 +934,7 @@ def search_sketchfab_models(
         if not models:
             return f"No models found matching '{query}'"
 
-        formatted_output = f"Found {len(models)} models matching '{query}':\n\n"
+        parts = [f"Found {len(models)} models matching '{query}':\n\n"]
 
         for model in models:
             if model is None:
@@ -781,7 +942,6 @@ def search_sketchfab_models(
 
             model_name = model.get("name", "Unnamed model")
             model_uid = model.get("uid", "Unknown ID")
-            formatted_output += f"- {model_name} (UID: {model_uid})\n"
 
             # Get user info with safety checks
             user = model.get("user") or {}
@@ -790,7 +950,6 @@ def search_sketchfab_models(
                 if isinstance(user, dict)
                 else "Unknown author"
             )
-            formatted_output += f"  Author: {username}\n"
 
             # Get license info with safety checks
             license_data = model.get("license") or {}
@@ -799,15 +958,20 @@ def search_sketchfab_models(
                 if isinstance(license_data, dict)
                 else "Unknown"
             )
-            formatted_output += f"  License: {license_label}\n"
 
             # Add face count and downloadable status
             face_count = model.get("faceCount", "Unknown")
             is_downloadable = "Yes" if model.get("isDownloadable") else "No"
-            formatted_output += f"  Face count: {face_count}\n"
-            formatted_output += f"  Downloadable: {is_downloadable}\n\n"
 
-        return formatted_output
+            parts.append(
+                f"- {model_name} (UID: {model_uid})\n"
+                f"  Author: {username}\n"
+                f"  License: {license_label}\n"
+                f"  Face count: {face_count}\n"
+                f"  Downloadable: {is_downloadable}\n\n"
+            )
+
+        return "".join(parts)
     except Exception as e:
         logger.error(f"Error searching Sketchfab models: {str(e)}")
         import traceback
@@ -901,27 +1065,28 @@ def download_sketchfab_model(ctx: Context, uid: str, target_size: float) -> str:
             imported_objects = result.get("imported_objects", [])
             object_names = ", ".join(imported_objects) if imported_objects else "none"
 
-            output = "Successfully imported model.\n"
-            output += f"Created objects: {object_names}\n"
+            parts = [f"Successfully imported model.\nCreated objects: {object_names}\n"]
 
             # Add dimension info if available
             if result.get("dimensions"):
                 dims = result["dimensions"]
-                output += (
+                parts.append(
                     f"Dimensions (X, Y, Z): {dims[0]:.3f} x {dims[1]:.3f} x {dims[2]:.3f} meters\n"
                 )
 
             # Add bounding box info if available
             if result.get("world_bounding_box"):
                 bbox = result["world_bounding_box"]
-                output += f"Bounding box: min={bbox[0]}, max={bbox[1]}\n"
+                parts.append(f"Bounding box: min={bbox[0]}, max={bbox[1]}\n")
 
             # Add normalization info if applied
             if result.get("normalized"):
                 scale = result.get("scale_applied", 1.0)
-                output += f"Size normalized: scale factor {scale:.6f} applied (target size: {target_size}m)\n"
+                parts.append(
+                    f"Size normalized: scale factor {scale:.6f} applied (target size: {target_size}m)\n"
+                )
 
-            return output
+            return "".join(parts)
         else:
             return f"Failed to download model: {result.get('message', 'Unknown error')}"
     except Exception as e:
@@ -932,17 +1097,30 @@ def download_sketchfab_model(ctx: Context, uid: str, target_size: float) -> str:
         return f"Error downloading Sketchfab model: {str(e)}"
 
 
+def _b64_file(path: str) -> str:
+    """Return a file's contents base64-encoded as ASCII text"""
+    # The raw bytes are released as soon as they are encoded, so only the
+    # encoded copy outlives the call
+    with open(path, "rb") as f:
+        return base64.b64encode(f.read()).decode("ascii")
+
+
 def _process_bbox(original_bbox: list[float] | list[int] | None) -> list[int] | None:
     if original_bbox is None:
         return None
-    # Validate all values are positive before any other processing
-    if any(i <= 0 for i in original_bbox):
-        raise ValueError("Incorrect number range: bbox must be bigger than zero!")
-    if all(isinstance(i, int) for i in original_bbox):
+    # Validate, detect all-int input and find the largest value in one pass
+    largest = 0
+    all_int = True
+    for i in original_bbox:
+        if i <= 0:
+            raise ValueError("Incorrect number range: bbox must be bigger than zero!")
+        if not isinstance(i, int):
+            all_int = False
+        if i > largest:
+            largest = i
+    if all_int:
         return original_bbox
-    return (
-        [int(float(i) / max(original_bbox) * 100) for i in original_bbox] if original_bbox else None
-    )
+    return [int(float(i) / largest * 100) for i in original_bbox]
 
 @telemetry_tool("generate_hyper3d_model_via_text")
 @mcp.tool()
@@ -1011,12 +1189,10 @@ def generate_hyper3d_model_via_images(
     if input_image_paths is None and input_image_urls is None:
         return "Error: No image given!"
     if input_image_paths is not None:
-        if not all(os.path.exists(i) for i in input_image_paths):
+        # isfile rather than exists: a directory would pass and then fail to open
+        if not all(os.path.isfile(i) for i in input_image_paths):
             return "Error: not all image paths are valid!"
-        images = []
-        for path in input_image_paths:
-            with open(path, "rb") as f:
-                images.append((Path(path).suffix, base64.b64encode(f.read()).decode("ascii")))
+        images = [(Path(path).suffix, _b64_file(path)) for path in input_image_paths]
     elif input_image_urls is not None:
         if not all(urlparse(i) for i in input_image_urls):
             return "Error: not all image URLs are valid!"
@@ -1246,7 +1422,8 @@ def asset_creation_strategy() -> str:
     return """When creating 3D content in Blender, always start by checking if integrations are available:
 
     0. Before anything, always check the scene from get_scene_info()
-    1. First use the following tools to verify if the following integrations are enabled:
+    1. First use get_integrations_status() to verify which of the following integrations are enabled in one call.
+       If it is unavailable, use each integration's own status tool below instead:
         1. PolyHaven
             Use get_polyhaven_status() to verify its status
             If PolyHaven is enabled:
@@ -1392,12 +1569,11 @@ def generate_material_from_image(
     Returns JSON with material properties and creation status.
     """
     try:
-        if not os.path.exists(image_path):
+        if not os.path.isfile(image_path):
             return json.dumps({"error": f"Image not found at {image_path}"})
 
         # Read and encode image
-        with open(image_path, "rb") as f:
-            image_data = base64.b64encode(f.read()).decode("ascii")
+        image_data = _b64_file(image_path)
 
         blender = get_blender_connection()
         result = blender.send_command(
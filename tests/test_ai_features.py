@@ -51,14 +51,14 @@ class TestGenerateMaterialFromImage:
     """Tests for generate_material_from_image tool."""
 
     @patch("blenderforge.server.open", create=True)
-    @patch("blenderforge.server.os.path.exists")
+    @patch("blenderforge.server.os.path.isfile")
     @patch("blenderforge.server.get_blender_connection")
-    def test_generate_material_from_image_success(self, mock_get_conn, mock_exists, mock_open):
+    def test_generate_material_from_image_success(self, mock_get_conn, mock_isfile, mock_open):
         """Test successful material generation from image."""
         from blenderforge.server import generate_material_from_image
 
         # Mock file exists and can be read
-        mock_exists.return_value = True
+        mock_isfile.return_value = True
         mock_open.return_value.__enter__.return_value.read.return_value = b"fake_image_data"
 
         mock_conn = MagicMock()
@@ -84,14 +84,24 @@ class TestGenerateMaterialFromImage:
         data = json.loads(result)
         assert "error" in data
 
+    def test_generate_material_from_image_directory(self, tmp_path):
+        """Test a directory path is rejected as a missing image."""
+        from blenderforge.server import generate_material_from_image
+
+        ctx = MagicMock()
+        result = generate_material_from_image(ctx, str(tmp_path))
+
+        data = json.loads(result)
+        assert data["error"] == f"Image not found at {tmp_path}"
+
     @patch("blenderforge.server.open", create=True)
-    @patch("blenderforge.server.os.path.exists")
+    @patch("blenderforge.server.os.path.isfile")
     @patch("blenderforge.server.get_blender_connection")
-    def test_generate_material_from_image_connection_error(self, mock_get_conn, mock_exists, mock_open):
+    def test_generate_material_from_image_connection_error(self, mock_get_conn, mock_isfile, mock_open):
         """Test material from image with connection error."""
         from blenderforge.server import generate_material_from_image
 
-        mock_exists.return_value = True
+        mock_isfile.return_value = True
         mock_open.return_value.__enter__.return_value.read.return_value = b"fake_image_data"
         mock_get_conn.side_effect = Exception("Connection failed")
 
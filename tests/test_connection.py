@@ -1,7 +1,7 @@
 """Tests for BlenderConnection class."""
 
 import json
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, call, patch
 
 import pytest
 
@@ -51,6 +51,61 @@ class TestBlenderConnection:
         assert conn.sock is not None
         mock_socket.connect.assert_called_once_with(("localhost", 9876))
 
+    @patch("socket.socket")
+    def test_connect_disables_nagle(self, mock_socket_class):
+        """Test connect sets TCP_NODELAY on the socket."""
+        import socket
+
+        from blenderforge.server import BlenderConnection
+
+        mock_socket = MagicMock()
+        mock_socket_class.return_value = mock_socket
+
+        conn = BlenderConnection(host="localhost", port=9876)
+        assert conn.connect() is True
+
+        mock_socket.setsockopt.assert_any_call(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    @patch("socket.socket")
+    def test_connect_enlarges_socket_buffers(self, mock_socket_class):
+        """Test connect sizes the kernel buffers before connecting."""
+        import socket
+
+        from blenderforge.server import SOCKET_BUFFER_SIZE, BlenderConnection
+
+        mock_socket = MagicMock()
+        mock_socket_class.return_value = mock_socket
+
+        conn = BlenderConnection(host="localhost", port=9876)
+        assert conn.connect() is True
+
+        expected = [
+            call.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, SOCKET_BUFFER_SIZE),
+            call.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, SOCKET_BUFFER_SIZE),
+            call.connect(("localhost", 9876)),
+        ]
+        calls = mock_socket.mock_calls
+        assert [c for c in calls if c in expected] == expected
+
+    @patch("socket.socket")
+    def test_connect_sets_response_timeout_once(self, mock_socket_class):
+        """Test the response timeout is applied once the connection is established."""
+        from blenderforge.server import CONNECT_TIMEOUT, RESPONSE_TIMEOUT, BlenderConnection
+
+        mock_socket = MagicMock()
+        mock_socket_class.return_value = mock_socket
+
+        conn = BlenderConnection(host="localhost", port=9876)
+        assert conn.connect() is True
+
+        expected = [
+            call.settimeout(CONNECT_TIMEOUT),
+            call.connect(("localhost", 9876)),
+            call.settimeout(RESPONSE_TIMEOUT),
+        ]
+        calls = mock_socket.mock_calls
+        assert [c for c in calls if c in expected] == expected
+
     @patch("socket.socket")
     def test_connect_already_connected(self, mock_socket_class):
         """Test connect when already connected returns True."""
@@ -218,6 +273,20 @@ class TestBlenderConnection:
         sent_data = json.loads(call_args.decode("utf-8"))
         assert sent_data["auth_token"] == "secret_token"
 
+    def test_send_command_requests_framing(self):
+        """Test commands ask the addon for length-prefixed responses."""
+        from blenderforge.server import BlenderConnection
+
+        mock_socket = MagicMock()
+        mock_socket.recv.return_value = json.dumps({"status": "success", "result": {}}).encode("utf-8")
+
+        conn = BlenderConnection(host="localhost", port=9876)
+        conn.sock = mock_socket
+        conn.send_command("test_command")
+
+        sent_data = json.loads(mock_socket.sendall.call_args[0][0].decode("utf-8"))
+        assert sent_data["framing"] == "length"
+
 
 class TestReceiveFullResponse:
     """Tests for the receive_full_response method."""
@@ -254,6 +323,66 @@ class TestReceiveFullResponse:
 
         assert json.loads(result.decode("utf-8")) == response
 
+    def test_receive_probes_only_plausible_endings(self):
+        """Test partial chunks that cannot end a JSON object are not parsed."""
+        from blenderforge import server as server_module
+        from blenderforge.server import BlenderConnection
+
+        response = {"status": "success", "result": {"items": list(range(50))}}
+        full_json = json.dumps(response).encode("utf-8")
+        chunks = [full_json[i : i + 16] for i in range(0, len(full_json), 16)]
+        chunks[-1] += b"\n"
+
+        mock_socket = MagicMock()
+        mock_socket.recv.side_effect = chunks
+
+        conn = BlenderConnection(host="localhost", port=9876)
+        with patch.object(
+            server_module, "_json_loads", wraps=server_module._json_loads
+        ) as mock_loads:
+            result = conn.receive_full_response(mock_socket)
+
+        assert json.loads(result) == response
+        probed = sum(1 for chunk in chunks if chunk.rstrip()[-1:] in (b"}", b"]"))
+        assert mock_loads.call_count == probed < len(chunks)
+
+    def test_receive_whitespace_chunk_checks_buffer_end(self):
+        """Test a whitespace-only chunk is judged by the buffer's last significant byte."""
+        from blenderforge import server as server_module
+        from blenderforge.server import BlenderConnection
+
+        # The first chunk ends in } inside a string, so its probe fails
+        chunks = [b'{"text": "a}', b" ", b'"}']
+        mock_socket = MagicMock()
+        mock_socket.recv.side_effect = chunks
+
+        conn = BlenderConnection(host="localhost", port=9876)
+        with patch.object(
+            server_module, "_json_loads", wraps=server_module._json_loads
+        ) as mock_loads:
+            result = conn.receive_full_response(mock_socket)
+
+        assert json.loads(result) == {"text": "a} "}
+        # The whitespace-only chunk is still probed because the buffer ends in }
+        assert mock_loads.call_count == 3
+
+    def test_receive_chunk_split_inside_utf8_character(self):
+        """Test a chunk boundary inside a multi-byte character keeps receiving."""
+        from blenderforge.server import BlenderConnection
+
+        response = {"status": "success", "result": {"name": "Würfel"}}
+        full_json = json.dumps(response, ensure_ascii=False).encode("utf-8")
+        # Split after the first byte of "ü" (UTF-8 C3 BC)
+        split = full_json.index(b"\xc3\xbc") + 1
+
+        mock_socket = MagicMock()
+        mock_socket.recv.side_effect = [full_json[:split], full_json[split:]]
+
+        conn = BlenderConnection(host="localhost", port=9876)
+        result = conn.receive_full_response(mock_socket)
+
+        assert json.loads(result.decode("utf-8")) == response
+
     def test_receive_empty_response(self):
         """Test handling empty response."""
         from blenderforge.server import BlenderConnection
@@ -265,3 +394,135 @@ class TestReceiveFullResponse:
 
         with pytest.raises(Exception, match="Connection closed|No data"):
             conn.receive_full_response(mock_socket)
+
+    def test_receive_framed_response(self):
+        """Test receiving a length-prefixed response whose payload spans reads."""
+        from blenderforge.server import BlenderConnection
+
+        payload = json.dumps({"status": "success", "result": {"key": "value"}}).encode("utf-8")
+        framed = len(payload).to_bytes(8, "big") + payload
+        remaining = [payload[12:]]
+
+        def recv_into(view):
+            data = remaining.pop(0)
+            view[: len(data)] = data
+            return len(data)
+
+        mock_socket = MagicMock()
+        # First read carries a split header, the second the rest of the header and some payload
+        mock_socket.recv.side_effect = [framed[:3], framed[3:20]]
+        mock_socket.recv_into.side_effect = recv_into
+
+        conn = BlenderConnection(host="localhost", port=9876)
+        result = conn.receive_full_response(mock_socket)
+
+        assert bytes(result) == payload
+        assert mock_socket.recv_into.call_count == 1
+
+    def test_receive_framed_response_connection_closed(self):
+        """Test a framed response cut short raises a connection error."""
+        from blenderforge.server import BlenderConnection
+
+        mock_socket = MagicMock()
+        mock_socket.recv.side_effect = [(100).to_bytes(8, "big") + b'{"status"']
+        mock_socket.recv_into.return_value = 0
+
+        conn = BlenderConnection(host="localhost", port=9876)
+
+        with pytest.raises(ConnectionError, match="full response"):
+            conn.receive_full_response(mock_socket)
+
+
+class TestGetBlenderConnection:
+    """Tests for the persistent connection health check."""
+
+    def test_ping_skipped_within_interval(self):
+        """Test a recently verified connection is reused without a ping."""
+        import blenderforge.server as server_module
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"enabled": True}
+
+        with patch.object(server_module, "_blender_connection", mock_conn), patch.object(
+            server_module, "_last_ping_time", float("-inf")
+        ):
+            assert server_module.get_blender_connection() is mock_conn
+            assert server_module.get_blender_connection() is mock_conn
+
+        mock_conn.send_command.assert_called_once_with("get_polyhaven_status")
+
+    def test_ping_after_connection_dropped(self):
+        """Test a connection whose socket was dropped is re-checked within the interval."""
+        import blenderforge.server as server_module
+
+        mock_conn = MagicMock()
+        mock_conn.sock = None
+        mock_conn.send_command.return_value = {"enabled": False}
+
+        with patch.object(server_module, "_blender_connection", mock_conn), patch.object(
+            server_module, "_last_ping_time", float("inf")
+        ):
+            assert server_module.get_blender_connection() is mock_conn
+
+        mock_conn.send_command.assert_called_once_with("get_polyhaven_status")
+
+    def test_ping_after_interval(self):
+        """Test the connection is pinged again once the interval has passed."""
+        import blenderforge.server as server_module
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"enabled": False}
+
+        with patch.object(server_module, "_blender_connection", mock_conn), patch.object(
+            server_module, "_last_ping_time", 0.0
+        ), patch.object(server_module, "time") as mock_time:
+            mock_time.monotonic.side_effect = [100.0, 100.0, 200.0, 200.0]
+            server_module.get_blender_connection()
+            server_module.get_blender_connection()
+
+        assert mock_conn.send_command.call_count == 2
+
+
+class TestJsonHelpers:
+    """Tests for the socket JSON encode/decode helpers."""
+
+    def test_round_trip(self):
+        """Test commands encode to UTF-8 bytes and decode back unchanged."""
+        from blenderforge.server import _json_dumps, _json_loads
+
+        command = {"type": "get_object_info", "params": {"name": "Würfel"}}
+        data = _json_dumps(command)
+
+        assert isinstance(data, bytes)
+        assert _json_loads(data) == command
+        assert _json_loads(bytearray(data)) == command
+
+    def test_stdlib_fallback(self):
+        """Test the helpers work without orjson installed."""
+        from blenderforge.server import _json_dumps, _json_loads
+
+        with patch("blenderforge.server.HAS_ORJSON", False):
+            data = _json_dumps({"status": "success", "result": [1, 2, 3]})
+            assert _json_loads(data) == {"status": "success", "result": [1, 2, 3]}
+
+    def test_non_finite_floats_fall_back_to_json(self):
+        """Test NaN/Infinity payloads parse even though orjson rejects them."""
+        import math
+
+        from blenderforge import server as server_module
+
+        fake_orjson = MagicMock()
+        fake_orjson.JSONDecodeError = json.JSONDecodeError
+        fake_orjson.loads.side_effect = json.JSONDecodeError("unexpected character", "", 0)
+
+        data = json.dumps({"status": "success", "result": {"bounds": [float("nan"), 1.0]}})
+        assert "NaN" in data
+
+        with patch.object(server_module, "HAS_ORJSON", True), patch.object(
+            server_module, "orjson", fake_orjson, create=True
+        ):
+            result = server_module._json_loads(data.encode("utf-8"))
+
+        fake_orjson.loads.assert_called_once()
+        assert math.isnan(result["result"]["bounds"][0])
+        assert result["result"]["bounds"][1] == 1.0
@@ -105,6 +105,28 @@ class TestCodeSecurityValidation:
             is_safe, error = validate_code_security(code)
             assert not is_safe, f"Code should be blocked: {code}"
 
+    def test_error_names_matched_pattern(self):
+        """Test that the error message reports the pattern that matched."""
+        from blenderforge.server import validate_code_security
+
+        is_safe, error = validate_code_security("import bpy\nshutil.rmtree('/tmp/x')")
+        assert not is_safe
+        assert error == r"Code contains potentially dangerous pattern: \bshutil\.rmtree\b"
+
+    def test_block_upper_case_variants(self):
+        """Test that blocked patterns also match regardless of case."""
+        from blenderforge.server import validate_code_security
+
+        blocked_codes = [
+            "OPEN = open\nOPEN('/tmp/x', 'w')",
+            "name = 'SUBPROCESS'.lower()",
+            "import bpy\nSocket = bpy.context.object",
+        ]
+
+        for code in blocked_codes:
+            is_safe, _ = validate_code_security(code)
+            assert not is_safe, f"Code should be blocked: {code}"
+
     def test_block_dynamic_import(self):
         """Test that __import__ is blocked."""
         from blenderforge.server import validate_code_security
@@ -127,6 +149,25 @@ class TestCodeSecurityValidation:
             is_safe, error = validate_code_security(code)
             assert not is_safe, f"Import should be blocked: {code}"
 
+    def test_import_checks_every_line(self):
+        """Test that imports are checked on every line, including indented ones."""
+        from blenderforge.server import validate_code_security
+
+        is_safe, error = validate_code_security("import bpy\nif True:\n    import sys\n")
+        assert not is_safe
+        assert "Import of 'sys'" in error
+
+        is_safe, error = validate_code_security("import bpy\n\tfrom pickle import loads")
+        assert not is_safe
+        assert "Import from 'pickle'" in error
+
+    def test_commented_import_ignored(self):
+        """Test that commented-out imports do not fail validation."""
+        from blenderforge.server import validate_code_security
+
+        is_safe, error = validate_code_security("# import sys\n  # from pickle import loads\nimport bpy")
+        assert is_safe, error
+
     def test_allowed_imports(self):
         """Test that allowed imports pass validation."""
         from blenderforge.server import ALLOWED_IMPORTS, validate_code_security
@@ -137,6 +178,35 @@ class TestCodeSecurityValidation:
             assert is_safe, f"Import should be allowed: {module}\nError: {error}"
 
 
+class TestValidationCache:
+    """Tests for caching of code validation results."""
+
+    def test_repeated_code_uses_cache(self):
+        """Test that validating the same snippet twice hits the cache."""
+        from blenderforge.server import _scan_code_cached, validate_code_security
+
+        _scan_code_cached.cache_clear()
+        code = "import bpy\nbpy.ops.mesh.primitive_cube_add()"
+
+        assert validate_code_security(code) == (True, "")
+        assert validate_code_security(code) == (True, "")
+        assert _scan_code_cached.cache_info().hits == 1
+
+    def test_large_code_not_cached(self):
+        """Test that snippets above the size limit bypass the cache."""
+        from blenderforge.server import (
+            VALIDATION_CACHE_MAX_CODE_SIZE,
+            _scan_code_cached,
+            validate_code_security,
+        )
+
+        _scan_code_cached.cache_clear()
+        code = "import bpy\n" + "x = 1\n" * (VALIDATION_CACHE_MAX_CODE_SIZE // 6 + 1)
+
+        assert validate_code_security(code) == (True, "")
+        assert _scan_code_cached.cache_info().currsize == 0
+
+
 class TestCodeExecutionToggle:
     """Tests for code execution enable/disable."""
 
@@ -211,7 +281,7 @@ class TestSecurityConstants:
         """Test that allowed imports are defined."""
         from blenderforge.server import ALLOWED_IMPORTS
 
-        assert isinstance(ALLOWED_IMPORTS, set)
+        assert isinstance(ALLOWED_IMPORTS, frozenset)
         assert "bpy" in ALLOWED_IMPORTS
         assert "mathutils" in ALLOWED_IMPORTS
         assert "bmesh" in ALLOWED_IMPORTS
@@ -89,6 +89,56 @@ class TestGetObjectInfo:
         assert "Error" in result
 
 
+class TestGetViewportScreenshot:
+    """Tests for get_viewport_screenshot tool."""
+
+    @patch("blenderforge.server.get_blender_connection")
+    def test_screenshot_success_removes_temp_file(self, mock_get_conn):
+        """Test the captured file is returned and its temp file deleted."""
+        import os
+
+        from blenderforge.server import get_viewport_screenshot
+
+        sent_paths = []
+
+        def send_command(command_type, params):
+            sent_paths.append(params["filepath"])
+            with open(params["filepath"], "wb") as f:
+                f.write(b"\x89PNG fake image")
+            return {"success": True}
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.side_effect = send_command
+        mock_get_conn.return_value = mock_conn
+
+        image = get_viewport_screenshot(MagicMock())
+
+        assert image.data == b"\x89PNG fake image"
+        assert not os.path.exists(sent_paths[0])
+
+    @patch("blenderforge.server.get_blender_connection")
+    def test_screenshot_error_removes_temp_file(self, mock_get_conn):
+        """Test the reserved temp file is deleted when Blender reports an error."""
+        import os
+
+        from blenderforge.server import get_viewport_screenshot
+
+        sent_paths = []
+
+        def send_command(command_type, params):
+            sent_paths.append(params["filepath"])
+            return {"error": "No 3D viewport found"}
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.side_effect = send_command
+        mock_get_conn.return_value = mock_conn
+
+        with pytest.raises(Exception, match="No 3D viewport found"):
+            get_viewport_screenshot(MagicMock())
+
+        assert not os.path.exists(sent_paths[0])
+
+
 class TestExecuteBlenderCode:
     """Tests for execute_blender_code tool."""
 
@@ -128,8 +178,10 @@ class TestPolyHavenTools:
     """Tests for PolyHaven integration tools."""
 
     @patch("blenderforge.server.get_blender_connection")
+    @patch("blenderforge.server._polyhaven_enabled", False)
     def test_get_polyhaven_status_enabled(self, mock_get_conn):
         """Test PolyHaven status when enabled."""
+        import blenderforge.server as server_module
         from blenderforge.server import get_polyhaven_status
 
         mock_conn = MagicMock()
@@ -143,10 +195,13 @@ class TestPolyHavenTools:
         result = get_polyhaven_status(ctx)
 
         assert "enabled" in result.lower() or "PolyHaven" in result
+        assert server_module._polyhaven_enabled is True
 
     @patch("blenderforge.server.get_blender_connection")
+    @patch("blenderforge.server._polyhaven_enabled", True)
     def test_get_polyhaven_status_disabled(self, mock_get_conn):
         """Test PolyHaven status when disabled."""
+        import blenderforge.server as server_module
         from blenderforge.server import get_polyhaven_status
 
         mock_conn = MagicMock()
@@ -160,6 +215,7 @@ class TestPolyHavenTools:
         result = get_polyhaven_status(ctx)
 
         assert "disabled" in result.lower() or "PolyHaven" in result
+        assert server_module._polyhaven_enabled is False
 
     @patch("blenderforge.server.get_blender_connection")
     @patch("blenderforge.server._polyhaven_enabled", True)
@@ -191,6 +247,49 @@ class TestPolyHavenTools:
         assert "disabled" in result.lower()
 
 
+class TestGetIntegrationsStatus:
+    """Tests for the batched integrations status tool."""
+
+    @patch("blenderforge.server.get_blender_connection")
+    def test_single_request(self, mock_get_conn):
+        """Test every integration is reported from one command."""
+        import blenderforge.server as server_module
+        from blenderforge.server import _POLYHAVEN_SUFFIX, get_integrations_status
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {
+            "polyhaven": {"enabled": True, "message": "PolyHaven is enabled. "},
+            "sketchfab": {"enabled": False, "message": "Sketchfab is disabled."},
+            "hyper3d": {"enabled": True, "message": "Hyper3D is enabled."},
+            "hunyuan3d": {"enabled": False, "mode": "LOCAL_API", "message": "Hunyuan3D is off."},
+        }
+        mock_get_conn.return_value = mock_conn
+
+        ctx = MagicMock()
+        with patch.object(server_module, "_polyhaven_enabled", False):
+            result = json.loads(get_integrations_status(ctx))
+            assert server_module._polyhaven_enabled is True
+
+        mock_conn.send_command.assert_called_once_with("get_integrations_status")
+        assert result["polyhaven"]["message"] == f"PolyHaven is enabled. {_POLYHAVEN_SUFFIX}"
+        assert result["sketchfab"]["message"] == "Sketchfab is disabled."
+        assert result["hunyuan3d"]["mode"] == "LOCAL_API"
+
+    @patch("blenderforge.server.get_blender_connection")
+    def test_error(self, mock_get_conn):
+        """Test an addon without the command reports an error string."""
+        from blenderforge.server import get_integrations_status
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.side_effect = Exception("Unknown command type")
+        mock_get_conn.return_value = mock_conn
+
+        ctx = MagicMock()
+        result = get_integrations_status(ctx)
+
+        assert "Error" in result
+
+
 class TestSketchfabTools:
     """Tests for Sketchfab integration tools."""
 
@@ -259,6 +358,35 @@ class TestHyper3DTools:
         # Result can vary but should contain status info
         assert isinstance(result, str)
 
+    @patch("blenderforge.server.get_blender_connection")
+    def test_generate_via_images_encodes_files(self, mock_get_conn, tmp_path):
+        """Test local images are sent base64-encoded with their suffix."""
+        import base64
+
+        from blenderforge.server import generate_hyper3d_model_via_images
+
+        image = tmp_path / "ref.png"
+        image.write_bytes(b"\x89PNG fake image data")
+
+        mock_conn = MagicMock()
+        mock_conn.send_command.return_value = {"error": "stop here"}
+        mock_get_conn.return_value = mock_conn
+
+        ctx = MagicMock()
+        generate_hyper3d_model_via_images(ctx, input_image_paths=[str(image)])
+
+        params = mock_conn.send_command.call_args[0][1]
+        assert params["images"] == [(".png", base64.b64encode(image.read_bytes()).decode("ascii"))]
+
+    def test_generate_via_images_rejects_directory(self, tmp_path):
+        """Test a directory is rejected instead of failing to open."""
+        from blenderforge.server import generate_hyper3d_model_via_images
+
+        ctx = MagicMock()
+        result = generate_hyper3d_model_via_images(ctx, input_image_paths=[str(tmp_path)])
+
+        assert result == "Error: not all image paths are valid!"
+
 
 class TestProcessBbox:
     """Tests for _process_bbox helper function."""
@@ -286,6 +414,19 @@ class TestProcessBbox:
         assert isinstance(result, list)
         assert len(result) == 3
 
+    def test_process_bbox_floats_scaled_to_largest(self):
+        """Test float bbox values are scaled so the largest becomes 100."""
+        from blenderforge.server import _process_bbox
+
+        assert _process_bbox([0.5, 2.0, 1]) == [25, 100, 50]
+
+    def test_process_bbox_invalid_after_float(self):
+        """Test a non-positive value is rejected wherever it appears."""
+        from blenderforge.server import _process_bbox
+
+        with pytest.raises(ValueError, match="bigger than zero"):
+            _process_bbox([1.5, 2.0, 0])
+
     def test_process_bbox_invalid_zero(self):
         """Test processing bbox with zero value."""
         from blenderforge.server import _process_bbox